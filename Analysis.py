@@ -1,116 +1,712 @@
 #!/usr/bin/env python3
-import networkit as nk
 import numpy as np
-import bz2
 import argparse
-from scipy.optimize import curve_fit
-from random import seed, choice
-import statsmodels.api as sm
+import hashlib
+import importlib.util
+import json
+import resource
+import sqlite3
+import sys
+import time
+from functools import cached_property
+from concurrent.futures import ProcessPoolExecutor
+import random
+from Network_IO import is_binary, prefetch, read_binary, read_graphml
+from Lattice_Metrics import has_closed_form, lattice_metrics
+from Ensemble import sorted_unique
+from Shared_Graph import share_arrays, attach_arrays, release_arrays, graph_arrays
 
 # Analysis Script
 #
 # Authors:
 #           Miko Stulajter
 #
-# Version 1.0.0
+# Version 1.14.13
 #
 
+### ~~~~~~ Module imported on its first attribute access, so runs that never use it, such as store
+### ~~~~~~ hits and closed forms, do not pay for its import
+def lazyImport(name):
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+nk = lazyImport('networkit')
+
 def argParsing():
+    args = analysisParser().parse_args()
+    if args.prefetch is None:
+        args.prefetch = 0 if args.lowmem else 1
+    return args
+
+
+### ~~~~~~ Parser of the analysis options, the client of Analysis_Server.py leaves out the store,
+### ~~~~~~ timing and verification options and may name a loaded graph instead of a file
+def analysisParser(client=False):
     parser = argparse.ArgumentParser(description='Analysis a network and report key properties.')
     
     parser.add_argument('-file',
-    help="Network file as a '.graphml.bz2' file.",
+    help="Network file as a '.graphml.bz2' or binary '.netbin' file, Analysis.py analyzes several in turn.",
     dest='file',
+    nargs=None if client else '+',
     type=str,
-    required=True)
+    required=not client)
 
     parser.add_argument('-cores',
-    help='Number of cores running on (Default is 1).',
+    help='Number of cores running on, also used to decompress the bz2 blocks of GraphML input (Default is 1).',
     dest='cores',
     default=1,
     type=int,
     required=False)
 
-    return parser.parse_args()
+    parser.add_argument('-seed',
+    help='CBB random seed (Default is random).',
+    dest='seed',
+    default=None,
+    type=int,
+    required=False)
+
+    parser.add_argument('-backend',
+    help="'analytic' for only the closed forms of unrewired lattices, without fractal dimension and growth exponent, 'bfs' for the full analysis or 'auto' for the full analysis taking the closed forms when the file metadata or -lattice describe an unrewired lattice (Default is auto).",
+    dest='backend',
+    choices=['auto', 'analytic', 'bfs'],
+    default='auto',
+    required=False)
+
+    parser.add_argument('-lattice',
+    help="Side length, dimensions and boundary condition ('1: non-periodic' or '2: periodic') of an unrewired lattice stored without metadata.",
+    dest='lattice',
+    nargs=3,
+    metavar=('L', 'D', 'BC'),
+    type=int,
+    required=False)
+
+    parser.add_argument('-lowmem',
+    help='Low memory mode running the box covering on numpy index arrays with a single reused BFS (Default is off).',
+    dest='lowmem',
+    action='store_true',
+    required=False)
+
+    parser.add_argument('-progress',
+    help='Report box covering progress every this many seconds, 0 for no reports (Default is 0).',
+    dest='progress',
+    default=0,
+    type=float,
+    required=False)
+
+    parser.add_argument('-status',
+    help='File the progress report is written to instead of stderr.',
+    dest='status',
+    type=str,
+    required=False)
+
+    parser.add_argument('-bfs',
+    help="BFS backend for the path length and growth exponent pass, 'networkit' one source at a time inside the first CBB or 'sparse' for batches of sources advanced by sparse matrix products (Default is networkit).",
+    dest='bfs',
+    choices=['networkit', 'sparse'],
+    default='networkit',
+    required=False)
+
+    parser.add_argument('-bfs-memory',
+    help='Memory budget in MB for the frontier matrices of a sparse BFS batch (Default is 256).',
+    dest='bfs_memory',
+    default=256,
+    type=float,
+    required=False)
+
+    parser.add_argument('-components',
+    help="Connected components the distance based metrics of a disconnected network are computed for, 'all' with at least 2 nodes or the 'giant' one (Default is all).",
+    dest='components',
+    choices=['all', 'giant'],
+    default='all',
+    required=False)
+
+    parser.add_argument('-path-sources',
+    help="Sources of the path length and growth exponent, 'cbb' inside the first CBB pass, 'all' or a number K of random sources in a separate pass over -cores processes (Default is cbb, all with -bfs sparse).",
+    dest='path_sources',
+    type=check_path_sources,
+    default='cbb',
+    required=False)
+
+    parser.add_argument('-box-sizes',
+    help="Box sizes CBB runs for, 'all' from 1 to diameter-1, 'log' for about 3 log2(diameter) log-spaced sizes or a number K of log-spaced sizes. 'log' and K stop once the box count reaches %d (Default is all)." % PLATEAU_BOXES,
+    dest='box_sizes',
+    type=check_box_sizes,
+    default='all',
+    required=False)
+
+    parser.add_argument('-refine',
+    help='Number of extra box sizes added where the fractal dimension fit residuals are largest (Default is 0).',
+    dest='refine',
+    default=0,
+    type=int,
+    required=False)
+
+    parser.add_argument('-fit',
+    help="Least squares fit of the fractal dimension, 'numpy' or 'statsmodels' OLS, which must be installed (Default is numpy).",
+    dest='fit',
+    choices=['numpy', 'statsmodels'],
+    default='numpy',
+    required=False)
+
+    if client:
+        return parser
+
+    parser.add_argument('-store',
+    help="SQLite file results are stored in and answered from, keyed by graph fingerprint, settings and seed. Runs without -seed are not stored (Default is no store).",
+    dest='store',
+    default='',
+    type=str,
+    required=False)
+
+    parser.add_argument('-force',
+    help='Recompute the results even if they are in the store.',
+    dest='force',
+    action='store_true',
+    required=False)
+
+    parser.add_argument('-prefetch',
+    help='Number of files read and parsed ahead on I/O threads while the current one is analyzed, 0 to read each file when its analysis starts (Default is 1, 0 with -lowmem).',
+    dest='prefetch',
+    default=None,
+    type=int,
+    required=False)
+
+    parser.add_argument('-timing',
+    help='Print the startup time, interpreter start up to the analysis, and the analysis time.',
+    dest='timing',
+    action='store_true',
+    required=False)
+
+    parser.add_argument('-verify',
+    help='Run both the analytic and the bfs backend and print their differences.',
+    dest='verify',
+    action='store_true',
+    required=False)
+
+    return parser
+
+
+def check_path_sources(value):
+    if value in ('cbb', 'all'):
+        return value
+    try:
+        K = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid choice: {value}. Choose 'cbb', 'all' or a positive number.")
+    if K < 1:
+        raise argparse.ArgumentTypeError(f"Invalid choice: {value}. Choose 'cbb', 'all' or a positive number.")
+    return K
+
+
+def check_box_sizes(value):
+    if value in ('all', 'log'):
+        return value
+    try:
+        K = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid choice: {value}. Choose 'all', 'log' or a positive number.")
+    if K < 1:
+        raise argparse.ArgumentTypeError(f"Invalid choice: {value}. Choose 'all', 'log' or a positive number.")
+    return K
 
 
 def main():
     ### ~~~~~~ Argument parsing
     args = argParsing()
+    startup = startupTime()
+    start = time.perf_counter()
+
+    ### ~~~~~~ Compare the closed forms with the computed values
+    if args.verify:
+        for file in args.file:
+            verifyLattice(file, args.cores, args.seed, args.lattice)
+        return
+
+    ### ~~~~~~ Analyze and print output, the next files are read while the current one is analyzed.
+    ### ~~~~~~ The edges are handed over in a list analyze empties, so none of them outlive the graph.
+    for file, edges in prefetch(lambda file: [inputEdges(file, args.backend, args.lattice, args.cores)], args.file, args.prefetch):
+        results = analyze(file, args.cores, args.seed, args.backend, args.lattice, args.store or None, args.force, edges,
+                          **{key: getattr(args, key) for key in ANALYZER_OPTIONS})
+        printResults(results)
+    print("Peak memory : %.1f MB" % peakMemory())
+    if args.timing:
+        print("Startup time : %.3f s" % startup)
+        print("Analysis time : %.3f s" % (time.perf_counter()-start))
+
+
+### ~~~~~~ Analyze a network file and return its properties. backend 'analytic' returns only the
+### ~~~~~~ closed forms of an unrewired lattice, described by the binary metadata or by lattice as
+### ~~~~~~ (L, d, bc), without the box covering metrics. 'auto' takes the closed forms of such a
+### ~~~~~~ lattice and computes the box covering metrics. Computed results are saved in the SQLite
+### ~~~~~~ file store and answered from it for the same graph, settings and seed unless force is set,
+### ~~~~~~ unseeded runs draw a random box covering and are neither stored nor answered from it.
+### ~~~~~~ edges are the file's (num_nodes, src, tar) if already read, or a list holding them that
+### ~~~~~~ analyze empties, released once the graph is built. The other options are those of
+### ~~~~~~ NetworkAnalyzer.
+def analyze(file, cores=1, seed=None, backend='bfs', lattice=None, store=None, force=False, edges=None, **options):
+    filename=file.rsplit('/', 1)[-1]
+    closed = closedForms(file, backend, lattice)
+    if backend == 'analytic':
+        return closed
+
+    ### ~~~~~~ Answer from the store if the same graph was analyzed with the same settings and seed
+    if isinstance(edges, list):
+        edges = edges.pop()
+    num_nodes, src, tar = readEdges(file, cores) if edges is None else edges
+    del edges
+    if seed is None:
+        store = None
+    if store:
+        con = openStore(store)
+        fingerprint = graphFingerprint(num_nodes, src, tar)
+        chosen = dict(ANALYZER_OPTIONS, **options)
+        settings = json.dumps(dict({key: chosen[key] for key in STORE_SETTINGS}, backend='bfs' if closed is None else 'auto', seed=seed), sort_keys=True)
+        cached = loadResults(con, fingerprint, settings)
+        if cached and not force:
+            return dict(cached, network=filename)
+
+    ### ~~~~~~ Analyze
+    analyzer = NetworkAnalyzer.fromEdges(num_nodes, src, tar, filename, cores, seed, **options)
+    del src, tar
+    if closed is not None:
+        analyzer.useKnown(closed)
+    results = analyzer.results()
+    if store:
+        saveResults(con, fingerprint, settings, results)
+    return results
 
-    ### ~~~~~~ CBB random seed
-    seed = None
 
-    ### ~~~~~~ Read and make undirected
-    filename=(args.file).rsplit('/', 1)[-1]
-    nk.setNumberOfThreads(int(args.cores))
-    gmlReader = nk.graphio.GraphMLReader()
-    with bz2.open(args.file) as file_tmp:
-        G = gmlReader.read(file_tmp)
-    H = nk.graphtools.toUndirected(G)
-    H.removeMultiEdges()
+### ~~~~~~ Closed form results of an unrewired lattice for the 'analytic' and 'auto' backends,
+### ~~~~~~ None if the full analysis has to run
+def closedForms(file, backend, lattice=None):
+    if backend == 'bfs':
+        return None
+    filename=file.rsplit('/', 1)[-1]
+    params = latticeParams(file, lattice)
+    if params is not None:
+        return dict(network=filename, **lattice_metrics(*params), frac_dim=None, growth_exp=None)
+    if backend == 'analytic':
+        raise ValueError(filename + ' is not an unrewired lattice with a closed form, give -lattice or use -backend bfs.')
+    return None
+
+
+### ~~~~~~ Metrics a NetworkAnalyzer computes, in the order printResults reports them
+METRICS = ['num_nodes', 'num_edges', 'density', 'ave_degree', 'square_clustering',
+           'diameter', 'ave_path_len', 'frac_dim', 'growth_exp']
+
+
+### ~~~~~~ Default NetworkAnalyzer options and the ones that change results, which key the store
+ANALYZER_OPTIONS = {'lowmem': False, 'progress': 0, 'status': None, 'box_sizes': 'all', 'refine': 0,
+                    'bfs': 'networkit', 'bfs_memory': 256, 'path_sources': 'cbb', 'components': 'all', 'fit': 'numpy'}
+STORE_SETTINGS = ['lowmem', 'box_sizes', 'refine', 'bfs', 'path_sources', 'components']
+
+
+### ~~~~~~ Analysis of one network as an importable API. The graph is loaded once and every metric is
+### ~~~~~~ computed on first access and memoized, so intermediates shared by several metrics, the
+### ~~~~~~ diameter, the first CBB pass, the shell counts and the box counts, are computed once.
+### ~~~~~~
+### ~~~~~~ lowmem runs the box covering on numpy index arrays with a single reused BFS. A progress
+### ~~~~~~ interval in seconds reports the box covering to stderr or the status file. box_sizes and
+### ~~~~~~ refine choose the box sizes CBB runs for, see boxSchedule and refineSize. bfs 'sparse'
+### ~~~~~~ computes path lengths and growth rates from batched BFS within bfs_memory MB. path_sources
+### ~~~~~~ 'all' or a number of sampled sources moves them to a separate pass over cores processes.
+### ~~~~~~ Disconnected networks get distance based metrics for 'all' components or the 'giant' one.
+### ~~~~~~ fromFile and fromEdges set the process wide networkit thread count to cores, the
+### ~~~~~~ constructor leaves it to the caller.
+###
+###     analyzer = NetworkAnalyzer.fromFile('RL-P_L10_d-3.graphml.bz2', seed=1)
+###     analyzer.square_clustering, analyzer.frac_dim
+class NetworkAnalyzer:
+    def __init__(self, H, name='', cores=1, seed=None, **options):
+        unknown = set(options) - set(ANALYZER_OPTIONS)
+        if unknown:
+            raise TypeError('Unknown NetworkAnalyzer options: ' + ', '.join(sorted(unknown)))
+        self.H = H
+        self.network = name
+        self.cores = int(cores)
+        self.seed = seed
+        self.opts = dict(ANALYZER_OPTIONS, **options)
+        if self.opts['path_sources'] == 'cbb' and self.opts['bfs'] == 'sparse':
+            self.opts['path_sources'] = 'all'
+
+    ### ~~~~~~ Analyzer of a '.graphml.bz2' or binary edge list network file
+    @classmethod
+    def fromFile(cls, file, cores=1, seed=None, **options):
+        num_nodes, src, tar = readEdges(file, cores)
+        return cls.fromEdges(num_nodes, src, tar, file.rsplit('/', 1)[-1], cores, seed, **options)
+
+    ### ~~~~~~ Analyzer of nodes 0..num_nodes-1 and (source, target) id arrays, as the undirected
+    ### ~~~~~~ graph GraphFromCoo builds, without multi-edges
+    @classmethod
+    def fromEdges(cls, num_nodes, src, tar, name='', cores=1, seed=None, **options):
+        nk.setNumberOfThreads(int(cores))
+        H = nk.GraphFromCoo((np.asarray(src).astype(np.uint64), np.asarray(tar).astype(np.uint64)), n=num_nodes)
+        H.removeMultiEdges()
+        return cls(H, name, cores, seed, **options)
 
     ### ~~~~~~~~ Nodes, Edges, Density
-    num_nodes=H.numberOfNodes()
-    num_edges=H.numberOfEdges()
-    density=nk.graphtools.density(H)
+    @cached_property
+    def num_nodes(self):
+        return self.H.numberOfNodes()
+
+    @cached_property
+    def num_edges(self):
+        return self.H.numberOfEdges()
+
+    @cached_property
+    def density(self):
+        return float(nk.graphtools.density(self.H))
 
     ### ~~~~~~~~ Average Degree
-    degree_run=nk.centrality.DegreeCentrality(H)
-    degree_run.run()
-    ave_degree=np.average(degree_run.scores())
+    @cached_property
+    def ave_degree(self):
+        degree_run=nk.centrality.DegreeCentrality(self.H)
+        degree_run.run()
+        return float(np.average(degree_run.scores()))
 
     ### ~~~~~~~~ Square Clustering
-    LC4=nk.centrality.LocalSquareClusteringCoefficient(H)
-    LC4.run()
-    Scores=LC4.scores()
-    LC2_Mean=np.mean(Scores)
+    @cached_property
+    def square_clustering(self):
+        LC4=nk.centrality.LocalSquareClusteringCoefficient(self.H)
+        LC4.run()
+        return float(np.mean(LC4.scores()))
+
+    ### ~~~~~~~~ Connected components
+    @cached_property
+    def connected_components(self):
+        cc = nk.components.ConnectedComponents(self.H)
+        cc.run()
+        return cc
+
+    @cached_property
+    def is_connected(self):
+        return self.connected_components.numberOfComponents() == 1
+
+    ### ~~~~~~~~ Distance based metrics of every analyzed component, None for a connected network
+    @cached_property
+    def components(self):
+        if self.is_connected:
+            return None
+        return componentMetrics(self.H, self.connected_components, self.cores, self.seed, self.opts, self.opts['components'])
+
+    @cached_property
+    def combined(self):
+        return combineComponents(self.components)
 
     ### ~~~~~~~~ Diameter
-    diam = nk.distance.Diameter(H,algo=1)
-    diam.run()
-    diameter=diam.getDiameter()[0]
+    @cached_property
+    def diameter(self):
+        if not self.is_connected:
+            return self.combined['diameter']
+        diam = nk.distance.Diameter(self.H,algo=1)
+        diam.run()
+        return int(diam.getDiameter()[0])
 
-    # ~~~~~~~~ Compact Box Burning, Path Length, Growth Exponent
-    if seed:
-        np.random.seed(seed)
+    ### ~~~~~~ Number of nodes at every distance from every node, one row per node
+    @cached_property
+    def shell_counts(self):
+        A=nk.algebraic.adjacencyMatrix(self.H,matrixType='sparse').astype(np.float32)
+        batch=bfsBatchSize(self.num_nodes,self.opts['bfs_memory'])
+        rows=[shellCounts(A,np.arange(start,min(start+batch,self.num_nodes))) for start in range(0,self.num_nodes,batch)]
+        shells=np.zeros((self.num_nodes,max(r.shape[1] for r in rows)),dtype=np.int64)
+        start=0
+        for r in rows:
+            shells[start:start+len(r),:r.shape[1]]=r
+            start+=len(r)
+        return shells
 
-    boxes_list = np.empty((diameter+1), dtype=float)
-    boxes_list[0]=num_nodes
+    @cached_property
+    def tracker(self):
+        if self.opts['progress'] <= 0:
+            return None
+        num_sizes=len(boxSchedule(self.diameter,self.opts['box_sizes']))+self.opts['refine']+(self.opts['path_sources'] != 'cbb')
+        return Progress(self.num_nodes, self.diameter, num_sizes, self.opts['progress'], self.opts['status'])
 
-    for indx in range(1,diameter):
-        if indx==1:
-            boxes,gamma,num_gamma,num_paths,path_len=CBB_L_GE(H,indx,num_nodes)
+    ### ~~~~~~ CBB at box size 1, run first after seeding the analyzer's own random generators so the
+    ### ~~~~~~ box covering depends neither on the order metrics are accessed in nor on other
+    ### ~~~~~~ analyzers running in between. Without a separate path length pass it also sums the
+    ### ~~~~~~ path lengths and growth rates, returns (boxes, growth rate sum, number of fits,
+    ### ~~~~~~ average path length) with None for the sums in that case.
+    @cached_property
+    def first_pass(self):
+        self.rand = random.Random(self.seed)
+        self.rng = np.random.default_rng(self.seed)
+        n = self.num_nodes
+        if self.opts['path_sources'] != 'cbb':
+            return coverBoxes(self.H,1,n,self.rng,self.opts['lowmem'],self.tracker,self.rand),None,None,None
+        if self.opts['lowmem']:
+            boxes,gamma,num_gamma,num_paths,path_len=CBB_LowMem(self.H,1,n,self.rng,True,self.tracker)
         else:
-            boxes=CBB_Only(H,indx)
-        boxes_list[indx]=boxes
+            boxes,gamma,num_gamma,num_paths,path_len=CBB_L_GE(self.H,1,n,self.tracker,self.rand)
+        return boxes,gamma,num_gamma,path_len/(num_paths+n/2)
+
+    ### ~~~~~~ (growth rate sum, number of fits, average path length), from the first CBB pass, the
+    ### ~~~~~~ shell counts if already computed or a separate pass over all or sampled sources
+    @cached_property
+    def paths_growth(self):
+        path_sources = self.opts['path_sources']
+        if path_sources == 'cbb':
+            return self.first_pass[1:]
+        if path_sources == 'all' and 'shell_counts' in self.__dict__:
+            gamma=0
+            num_gamma=0
+            for arr in self.shell_counts:
+                growth=fitGrowth(np.trim_zeros(arr,'b'),self.num_nodes)
+                if growth is not None:
+                    gamma+=growth
+                    num_gamma+=1
+            path_total=float((self.shell_counts*np.arange(self.shell_counts.shape[1])).sum())
+            return gamma,num_gamma,path_total/self.num_nodes**2
+        if path_sources == 'all':
+            sources = np.arange(self.num_nodes)
+        else:
+            sources = np.sort(np.random.default_rng(None if self.seed is None else [self.seed, 1]).choice(self.num_nodes, min(path_sources, self.num_nodes), replace=False))
+        return pathsGrowth(self.H,self.num_nodes,sources,self.cores,self.opts['bfs'],self.opts['bfs_memory'],self.tracker)
+
+    ### ~~~~~~ Box counts by box size over the schedule, refined where the fit residuals are largest
+    @cached_property
+    def box_counts(self):
+        diameter = self.diameter
+        box_sizes = self.opts['box_sizes']
+        box_counts = {0: self.num_nodes, 1: self.first_pass[0]}
+        for indx in boxSchedule(diameter, box_sizes)[1:]:
+            if box_sizes != 'all' and min(box_counts.values()) <= PLATEAU_BOXES:
+                break
+            box_counts[indx]=coverBoxes(self.H,indx,self.num_nodes,self.rng,self.opts['lowmem'],self.tracker,self.rand)
+        box_counts[diameter]=1
+        for r in range(self.opts['refine']):
+            indx=refineSize(box_counts)
+            if indx is None:
+                break
+            box_counts[indx]=coverBoxes(self.H,indx,self.num_nodes,self.rng,self.opts['lowmem'],self.tracker,self.rand)
+        if self.tracker is not None:
+            self.tracker.report(max(indx for indx in box_counts if indx < diameter), self.num_nodes)
+        return box_counts
+
+    ### ~~~~~~ Calculate Average Path Length
+    @cached_property
+    def ave_path_len(self):
+        if not self.is_connected:
+            return self.combined['ave_path_len']
+        return float(self.paths_growth[2])
+
+    ### ~~~~~~ Calculate Fractal Dimension on the evaluated box sizes
+    @cached_property
+    def frac_dim(self):
+        if not self.is_connected:
+            return self.combined['frac_dim']
+        return fitDimension(self.box_counts, self.opts['fit'])
 
-    boxes_list[diameter]=1
-    box_length=list(range(1,diameter+2))
+    ### ~~~~~~ Calculate Average Growth Factor
+    @cached_property
+    def growth_exp(self):
+        if not self.is_connected:
+            return self.combined['growth_exp']
+        gamma,num_gamma,ave_path_len=self.paths_growth
+        return float(np.exp(gamma/num_gamma)) if num_gamma else float('nan')
 
-    ### ~~~~~~ Calculate Fractal Dimension
-    x=np.log(np.array(box_length).reshape((-1, 1)))
-    y=np.log(np.array(boxes_list))
-    x = sm.add_constant(x)
-    CBB_model = sm.OLS(y,x).fit()
-    frac_dim=np.abs(CBB_model.params[1])
+    ### ~~~~~~ Take known metric values, such as the closed forms of a lattice, instead of computing
+    ### ~~~~~~ them, the box covering then also uses the known diameter
+    def useKnown(self, metrics):
+        for name in METRICS:
+            if metrics.get(name) is not None:
+                self.__dict__[name] = metrics[name]
 
-    ### ~~~~~~ Calculate Average Path Length and Average Growth Factor 
-    ave_path_len = path_len/(num_paths+num_nodes/2)
-    growth_exp=np.exp(gamma/num_gamma)
+    ### ~~~~~~ Diameter, path length, fractal dimension and growth exponent
+    def distanceMetrics(self):
+        return {'diameter': self.diameter,
+                'ave_path_len': self.ave_path_len,
+                'frac_dim': self.frac_dim,
+                'growth_exp': self.growth_exp}
 
-    ### ~~~~~~ Print Output
+    ### ~~~~~~ Every metric as the dictionary printResults takes
+    def results(self):
+        results = {'network': self.network,
+                   'num_nodes': self.num_nodes,
+                   'num_edges': self.num_edges,
+                   'density': self.density,
+                   'ave_degree': self.ave_degree,
+                   'square_clustering': self.square_clustering,
+                   **self.distanceMetrics()}
+        if self.components is not None:
+            results['num_components'] = self.connected_components.numberOfComponents()
+            results['components'] = self.components
+        return results
+
+
+### ~~~~~~ Components with fewer nodes have no distance based metrics
+MIN_COMPONENT_NODES = 2
+
+### ~~~~~~ Secondary components with fewer nodes get their exact diameter and average path length
+### ~~~~~~ from all pairs BFS, without the box covering and growth fits, whose fractal dimension and
+### ~~~~~~ growth exponent are left out of the node weighted means
+SMALL_COMPONENT_NODES = 32
+
+
+### ~~~~~~ Distance based metrics of every connected component with at least MIN_COMPONENT_NODES
+### ~~~~~~ nodes, or of the largest one only, largest first. Components of SMALL_COMPONENT_NODES or
+### ~~~~~~ more, and the largest one whatever its size, are analyzed in cores processes when there
+### ~~~~~~ are several, each with a seed derived from the seed and its rank, the smaller ones in bulk
+### ~~~~~~ by smallComponentMetrics.
+def componentMetrics(H, cc, cores, seed, opts, components='all'):
+    members = sorted(cc.getComponents(), key=len, reverse=True)
+    members = [np.sort(np.array(nodes, dtype=np.int64)) for nodes in members if len(nodes) >= MIN_COMPONENT_NODES]
+    if components == 'giant':
+        members = members[:1]
+    A = nk.algebraic.adjacencyMatrix(H, matrixType='sparse').tocsr()
+    tasks = []
+    for rank, nodes in enumerate(members):
+        if rank > 0 and len(nodes) < SMALL_COMPONENT_NODES:
+            break
+        sub = A[nodes][:, nodes].tocoo()
+        upper = sub.row <= sub.col
+        component_seed = None if seed is None else int(np.random.SeedSequence([seed, rank]).generate_state(1, np.uint64)[0] >> np.uint64(1))
+        tasks.append((len(nodes), sub.row[upper], sub.col[upper], component_seed, opts))
+    if cores > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=cores,initializer=nk.setNumberOfThreads,initargs=(1,)) as pool:
+            per_component = list(pool.map(componentTask, tasks))
+    else:
+        per_component = [componentTask(task, cores) for task in tasks]
+    per_component += smallComponentMetrics(A, members[len(tasks):])
+    return [dict(size=len(nodes), **metrics) for nodes, metrics in zip(members, per_component)]
+
+
+### ~~~~~~ Diameter and average path length of small components, from the distances between all
+### ~~~~~~ nodes of a component, which are at most SMALL_COMPONENT_NODES^2 per component
+def smallComponentMetrics(A, members):
+    from scipy.sparse.csgraph import shortest_path
+    metrics = []
+    for nodes in members:
+        dist = shortest_path(A[nodes][:, nodes], unweighted=True)
+        metrics.append({'diameter': int(dist.max()),
+                        'ave_path_len': float(dist.sum()/len(nodes)**2),
+                        'frac_dim': float('nan'),
+                        'growth_exp': float('nan')})
+    return metrics
+
+
+def componentTask(task, cores=1):
+    num_nodes, src, tar, seed, opts = task
+    H = nk.GraphFromCoo((src.astype(np.uint64), tar.astype(np.uint64)), n=num_nodes)
+    return NetworkAnalyzer(H, '', cores, seed, **opts).distanceMetrics()
+
+
+### ~~~~~~ Largest diameter and node weighted means of the other metrics over the components, a
+### ~~~~~~ diameter of 0 and NaN means when no component has MIN_COMPONENT_NODES nodes
+def combineComponents(per_component):
+    sizes = np.array([c['size'] for c in per_component], dtype=float)
+    combined = {'diameter': max((c['diameter'] for c in per_component), default=0)}
+    for key in ['ave_path_len', 'frac_dim', 'growth_exp']:
+        values = np.array([c[key] for c in per_component], dtype=float)
+        finite = np.isfinite(values)
+        combined[key] = float(np.average(values[finite], weights=sizes[finite])) if finite.any() else float('nan')
+    return combined
+
+
+### ~~~~~~ Print Output
+def printResults(results):
     print(" ")
-    print('Network Analyzed : ' + filename)
-    print('Number of nodes : ' + str(num_nodes))
-    print('Number of edges : ' + str(num_edges))
-    print("Density : %.5E" % density)
-    print("Average degree : %.5f" % ave_degree)
-    print("Average square clustering coefficient : %.5f" % LC2_Mean)
-    print('Diameter : ' + str(diameter))
-    print("Average path length : %.5f" % ave_path_len)
-    print("Fractal dimension : %.5f" % frac_dim)
-    print("Growth exponent : %.5f" % growth_exp)
+    print('Network Analyzed : ' + results['network'])
+    print('Number of nodes : ' + str(results['num_nodes']))
+    print('Number of edges : ' + str(results['num_edges']))
+    print("Density : %.5E" % results['density'])
+    print("Average degree : %.5f" % results['ave_degree'])
+    print("Average square clustering coefficient : %.5f" % results['square_clustering'])
+    print('Diameter : ' + str(results['diameter']))
+    print("Average path length : %.5f" % results['ave_path_len'])
+    if results['frac_dim'] is None:
+        print("Fractal dimension : not computed by the analytic backend")
+        print("Growth exponent : not computed by the analytic backend")
+    else:
+        print("Fractal dimension : %.5f" % results['frac_dim'])
+        print("Growth exponent : %.5f" % results['growth_exp'])
+    if 'components' in results:
+        print('Connected components : %d, node weighted over the %d analyzed, diameter is the largest' % (results['num_components'], len(results['components'])))
+        for rank, c in enumerate(results['components']):
+            print("  Component %d : %d nodes, diameter %d, average path length %.5f, fractal dimension %.5f, growth exponent %.5f"
+                  % (rank, c['size'], c['diameter'], c['ave_path_len'], c['frac_dim'], c['growth_exp']))
+
+
+### ~~~~~~ (L, d, periodic) of an unrewired lattice with closed forms, from -lattice or the binary metadata
+def latticeParams(file, lattice=None):
+    if lattice is not None:
+        L, d, bc = lattice
+    elif is_binary(file):
+        meta = read_binary(file)[0]
+        if meta.get('model') not in ('LP', 'LNP') or meta.get('rp') != 0:
+            return None
+        L, d, bc = meta['L'], meta['d'], meta['bc']
+    else:
+        return None
+    if not has_closed_form(L, d, bc == 2):
+        return None
+    return L, d, bc == 2
+
+
+### ~~~~~~ Print the analytic and computed values of every closed form metric side by side
+def verifyLattice(file, cores=1, seed=None, lattice=None):
+    analytic = analyze(file, cores, seed, 'analytic', lattice)
+    computed = analyze(file, cores, seed, 'bfs')
+    print(" ")
+    print('Network Verified : ' + analytic['network'])
+    for key in ['num_nodes', 'num_edges', 'density', 'ave_degree', 'square_clustering', 'diameter', 'ave_path_len']:
+        diff = abs(analytic[key]-computed[key])
+        status = 'ok' if diff <= 1e-9*max(1, abs(computed[key])) else 'MISMATCH'
+        print("%s : analytic %.10g, computed %.10g, %s" % (key, analytic[key], computed[key], status))
+
+
+### ~~~~~~ Read a '.graphml.bz2' or binary edge list network as (number of nodes, source ids, target ids),
+### ~~~~~~ the bz2 blocks are decompressed in jobs processes
+def readEdges(file, jobs=1):
+    if is_binary(file):
+        meta, edges = read_binary(file)
+        return meta['num_nodes'], edges[:,0], edges[:,1]
+    return read_graphml(file, jobs)
+
+
+### ~~~~~~ Edges analyze needs from a file, None when only the closed forms of a lattice are asked for
+def inputEdges(file, backend, lattice=None, jobs=1):
+    if backend == 'analytic' and latticeParams(file, lattice) is not None:
+        return None
+    return readEdges(file, jobs)
+
+
+### ~~~~~~ Canonical graph fingerprint, the hash of the node count and the sorted, deduplicated
+### ~~~~~~ undirected edges packed as min(u, v)*n + max(u, v)
+def graphFingerprint(num_nodes, src, tar):
+    src = np.asarray(src, dtype=np.uint64)
+    tar = np.asarray(tar, dtype=np.uint64)
+    packed = sorted_unique(np.minimum(src, tar)*np.uint64(num_nodes) + np.maximum(src, tar))
+    digest = hashlib.sha256(b'%d\n' % num_nodes)
+    digest.update(packed.astype('<u8').tobytes())
+    return digest.hexdigest()
+
+
+### ~~~~~~ Results store, one row per metric of a graph fingerprint and settings
+def openStore(store):
+    con = sqlite3.connect(store)
+    con.execute('CREATE TABLE IF NOT EXISTS analysis (fingerprint TEXT, settings TEXT, metric TEXT, value TEXT, network TEXT, '
+                'PRIMARY KEY (fingerprint, settings, metric))')
+    return con
+
+
+def loadResults(con, fingerprint, settings):
+    rows = con.execute('SELECT metric, value FROM analysis WHERE fingerprint = ? AND settings = ?', (fingerprint, settings))
+    return {metric: json.loads(value) for metric, value in rows}
+
+
+def saveResults(con, fingerprint, settings, results):
+    with con:
+        con.executemany('INSERT OR REPLACE INTO analysis VALUES (?, ?, ?, ?, ?)',
+                        [(fingerprint, settings, metric, json.dumps(value), results['network'])
+                         for metric, value in results.items() if metric != 'network'])
 
 
 ### ~~~~~~ Sigmoid fit function
@@ -119,8 +715,197 @@ def sigmoid(x, L ,x0, k, b):
     return (y)
 
 
+### ~~~~~~ Growth rate of the number of nodes within distance r of a node from a sigmoid fit,
+### ~~~~~~ arr is the number of nodes at every distance
+def fitGrowth(arr,num_nodes):
+    from scipy.optimize import curve_fit
+    i=1
+    start=i
+    ydata=[]
+    curr_len=0
+    while curr_len != num_nodes and i <= len(arr):
+        curr_len=sum(arr[0 : i+1])
+        i+=1
+        ydata.append(curr_len)
+    xdata=list(range(start,i))
+    p0 = [max(ydata), np.median(xdata),1,min(ydata)]
+    try:
+        popt, pcov = curve_fit(sigmoid, xdata, ydata,p0, method='dogbox')
+        return popt[2]
+    except Exception as e:
+        print(e)
+        return None
+
+
+### ~~~~~~ Box count below which the log-spaced schedules stop
+PLATEAU_BOXES = 2
+
+
+### ~~~~~~ Box sizes 1..diameter-1 CBB runs for in increasing order, all of them, about 3 log2(diameter)
+### ~~~~~~ log-spaced ones for 'log' or K log-spaced ones. Size 1 is always run for the path lengths.
+def boxSchedule(diameter, box_sizes):
+    if box_sizes == 'all' or diameter < 3:
+        return list(range(1, max(diameter, 2)))
+    K = int(np.ceil(3*np.log2(diameter))) if box_sizes == 'log' else box_sizes
+    sizes = np.round(np.geomspace(1, diameter-1, max(K, 1))).astype(int)
+    return sorted(set(sizes.tolist()) | {1})
+
+
+### ~~~~~~ Box size between the two neighboring evaluated sizes whose log-log fit residuals are
+### ~~~~~~ largest, None if every size between the evaluated ones has been run
+def refineSize(box_counts):
+    sizes = np.array(sorted(box_counts))
+    x = np.log(sizes+1)
+    y = np.log(np.array([box_counts[indx] for indx in sizes], dtype=float))
+    residuals = np.abs(y - np.polyval(np.polyfit(x, y, 1), x))
+    score = np.where(np.diff(sizes) > 1, residuals[:-1]+residuals[1:], -1)
+    if len(score) == 0 or score.max() < 0:
+        return None
+    b = int(np.argmax(score))
+    return int((sizes[b]+sizes[b+1])//2)
+
+
+### ~~~~~~ Fractal dimension, the slope of log box counts against log box lengths
+def fitDimension(box_counts, fit='numpy'):
+    sizes = np.array(sorted(box_counts))
+    x = np.log(sizes+1)
+    y = np.log(np.array([box_counts[indx] for indx in sizes], dtype=float))
+    if fit == 'statsmodels':
+        import statsmodels.api as sm
+        return float(np.abs(sm.OLS(y,sm.add_constant(x.reshape((-1, 1)))).fit().params[1]))
+    return float(np.abs(np.polyfit(x, y, 1)[0]))
+
+
+### ~~~~~~ Number of boxes of size indx with the regular or low memory CBB, centers are drawn from
+### ~~~~~~ rand or, in low memory mode, from rng
+def coverBoxes(H,indx,num_nodes,rng,lowmem,progress=None,rand=random):
+    if lowmem:
+        return CBB_LowMem(H,indx,num_nodes,rng,False,progress)
+    return CBB_Only(H,indx,progress,rand)
+
+
+### ~~~~~~ Shell counts of BFS from a batch of sources at once, one row per source with the number of
+### ~~~~~~ nodes at every distance. The n x B frontier matrix is advanced by the product with the
+### ~~~~~~ sparse adjacency matrix A and masked by the nodes visited so far.
+def shellCounts(A,sources):
+    batch=len(sources)
+    visited=np.zeros((A.shape[0],batch),dtype=bool)
+    visited[sources,np.arange(batch)]=True
+    frontier=visited.astype(np.float32)
+    shells=[np.ones(batch,dtype=np.int64)]
+    while True:
+        reached=A @ frontier > 0
+        reached&=~visited
+        counts=reached.sum(axis=0)
+        if not counts.any():
+            break
+        shells.append(counts)
+        visited|=reached
+        frontier=reached.astype(np.float32)
+    return np.array(shells).T
+
+
+### ~~~~~~ Sources per sparse BFS batch so that the visited, reached and frontier matrices and the
+### ~~~~~~ product, 10 bytes per node and source, fit in memory MB
+def bfsBatchSize(num_nodes,memory):
+    return int(max(1,min(num_nodes,memory*2**20//(10*num_nodes))))
+
+
+### ~~~~~~ Graph of the path length pool workers, set by initPathWorker
+WORKER = {}
+
+
+### ~~~~~~ Attach a path length pool worker to the graph arrays in shared memory
+def initPathWorker(spec,bfs):
+    WORKER.update(pathWorker(spec,bfs))
+
+
+### ~~~~~~ Graph a path length pass runs on. The CSR adjacency in shared memory is viewed as a sparse
+### ~~~~~~ matrix without copying it, BFS then run on it with csgraph or, for the sparse backend,
+### ~~~~~~ with shellCounts. The calling process passes its own graph H instead and keeps the
+### ~~~~~~ returned dictionary to itself, so concurrent passes do not share it.
+def pathWorker(spec,bfs,H=None):
+    worker={'bfs': bfs}
+    if H is not None:
+        worker['H']=H
+        if bfs == 'sparse':
+            worker['A']=nk.algebraic.adjacencyMatrix(H,matrixType='sparse').astype(np.float32)
+        worker['num_nodes']=H.numberOfNodes()
+        return worker
+    from scipy.sparse import csr_matrix
+    worker['blocks'],arrays=attach_arrays(spec)
+    num_nodes=len(arrays['degree'])
+    worker['A']=csr_matrix((arrays['data'],arrays['indices'],arrays['indptr']),shape=(num_nodes,num_nodes),copy=False)
+    worker['num_nodes']=num_nodes
+    return worker
+
+
+### ~~~~~~ Partial sums (distance sum, growth rate sum, number of fits) over a chunk of sources, on
+### ~~~~~~ the graph of worker or, in a pool worker, of WORKER
+def pathPartial(sources,worker=None):
+    worker=WORKER if worker is None else worker
+    num_nodes=worker['num_nodes']
+    if worker['bfs'] == 'sparse':
+        shells=shellCounts(worker['A'],sources)
+    elif 'H' not in worker:
+        from scipy.sparse.csgraph import shortest_path
+        dist=shortest_path(worker['A'],unweighted=True,indices=sources)
+        shells=[np.bincount(row.astype(int)) for row in dist]
+    else:
+        bfs=nk.distance.BFS(worker['H'],0,storePaths=False)
+        shells=[]
+        for p in sources:
+            bfs.setSource(int(p))
+            bfs.run()
+            shells.append(np.bincount(np.asarray(bfs.getDistances(asarray=True)).astype(int)))
+    path_total=0.0
+    gamma=0
+    num_gamma=0
+    for arr in shells:
+        path_total+=float((arr*np.arange(len(arr))).sum())
+        growth=fitGrowth(arr,num_nodes)
+        if growth is not None:
+            gamma+=growth
+            num_gamma+=1
+    return path_total,gamma,num_gamma
+
+
+### ~~~~~~ Path length and growth exponent pass independent of CBB, mapped over chunks of the
+### ~~~~~~ sources in jobs processes and reduced from their partial sums. The workers share one
+### ~~~~~~ copy of the graph arrays in shared memory. Returns the growth rate sum, the number of fits
+### ~~~~~~ and the mean distance from the sources to all nodes.
+def pathsGrowth(H,num_nodes,sources,jobs,bfs,memory,progress=None):
+    if bfs == 'sparse' or jobs > 1:
+        size=bfsBatchSize(num_nodes,memory)
+    else:
+        size=len(sources)
+    size=max(1,min(size,-(-len(sources)//(4*jobs))))
+    chunks=[sources[i:i+size] for i in range(0,len(sources),size)]
+    totals=np.zeros(3)
+    if jobs > 1:
+        # float32 weights for the sparse products of shellCounts, float64 ones csgraph uses as they are
+        blocks,spec=share_arrays(graph_arrays(H,np.float32 if bfs == 'sparse' else np.float64))
+        try:
+            with ProcessPoolExecutor(max_workers=jobs,initializer=initPathWorker,initargs=(spec,bfs)) as pool:
+                parts=pool.map(pathPartial,chunks)
+                for done,(chunk,part) in enumerate(zip(chunks,parts)):
+                    totals+=part
+                    if progress is not None:
+                        progress.step(1,done*size+len(chunk),len(chunk),len(chunk))
+        finally:
+            release_arrays(blocks,unlink=True)
+    else:
+        worker=pathWorker(None,bfs,H)
+        for done,chunk in enumerate(chunks):
+            totals+=pathPartial(chunk,worker)
+            if progress is not None:
+                progress.step(1,done*size+len(chunk),len(chunk),len(chunk))
+    path_total,gamma,num_gamma=totals
+    return gamma,int(num_gamma),path_total/(len(sources)*num_nodes)
+
+
 ### ~~~~~~ CBB, L, GE Function
-def CBB_L_GE(H,el,num_nodes):
+def CBB_L_GE(H,el,num_nodes,progress=None,rand=random):
     path_len = 0
     num_paths = 0
     gamma = 0
@@ -132,7 +917,7 @@ def CBB_L_GE(H,el,num_nodes):
         candidate_set = uncovered_nodes.copy()
         box = set()
         while len(candidate_set) > 0:
-            p = choice(list(candidate_set))
+            p = rand.choice(list(candidate_set))
             candidate_set.discard(p)
             box.add(p)
             k_fa = set([])
@@ -140,22 +925,10 @@ def CBB_L_GE(H,el,num_nodes):
             spsp.run()
             dist = spsp.getDistances()
             arr=np.bincount((np.array(dist[0]).astype(int)))
-            i=1
-            start=i
-            ydata=[]
-            curr_len=0
-            while curr_len != num_nodes:
-                curr_len=sum(arr[0 : i+1])
-                i+=1
-                ydata.append(curr_len)
-            xdata=list(range(start,i))
-            p0 = [max(ydata), np.median(xdata),1,min(ydata)]
-            try:
-                popt, pcov = curve_fit(sigmoid, xdata, ydata,p0, method='dogbox')
-                gamma+=popt[2]
+            growth=fitGrowth(arr,num_nodes)
+            if growth is not None:
+                gamma+=growth
                 num_gamma+=1
-            except Exception as e:
-                print(e)
             rangeTOcheck=set(range(p+1,num_nodes))
             for k in candidate_set:
                 temp = dist[0][k]
@@ -171,12 +944,14 @@ def CBB_L_GE(H,el,num_nodes):
                 path_len += temp
             candidate_set = candidate_set - k_fa
             uncovered_nodes.remove(p)
+            if progress is not None:
+                progress.step(el, num_nodes-len(uncovered_nodes), 1)
         boxes+=1
     return boxes,gamma,num_gamma,num_paths,path_len
 
 
 ### ~~~~~~ CBB Function only
-def CBB_Only(H,el):
+def CBB_Only(H,el,progress=None,rand=random):
     boxes = 0
     nodes_list=list(H.iterNodes())
     uncovered_nodes = set(nodes_list)
@@ -184,7 +959,7 @@ def CBB_Only(H,el):
         candidate_set = uncovered_nodes.copy()
         box = set()
         while len(candidate_set) > 0:
-            p = choice(list(candidate_set))
+            p = rand.choice(list(candidate_set))
             candidate_set.discard(p)
             box.add(p)
             k_fa = set([])
@@ -195,9 +970,112 @@ def CBB_Only(H,el):
                     k_fa.add(k)
             candidate_set = candidate_set - k_fa
             uncovered_nodes.remove(p)
+            if progress is not None:
+                progress.step(el, len(nodes_list)-len(uncovered_nodes))
+        boxes+=1
+    return boxes
+
+
+### ~~~~~~ CBB in low memory mode: candidates are kept in one preallocated index array, picked
+### ~~~~~~ with numpy's generator and compacted in place, and a single BFS is reused for every
+### ~~~~~~ center. With paths the path length and growth exponent sums of CBB_L_GE are returned too.
+def CBB_LowMem(H,el,num_nodes,rng,paths=False,progress=None):
+    path_len = 0
+    num_paths = 0
+    gamma = 0
+    num_gamma = 0
+    boxes = 0
+    uncovered = np.ones(num_nodes, dtype=bool)
+    num_uncovered = num_nodes
+    candidates = np.empty(num_nodes, dtype=np.int64)
+    bfs = nk.distance.BFS(H, 0, storePaths=False)
+    while num_uncovered > 0:
+        num_cand = num_uncovered
+        candidates[:num_cand] = np.flatnonzero(uncovered)
+        while num_cand > 0:
+            i = rng.integers(num_cand)
+            p = int(candidates[i])
+            num_cand -= 1
+            candidates[i] = candidates[num_cand]
+            bfs.setSource(p)
+            bfs.run()
+            dist = np.asarray(bfs.getDistances(asarray=True))
+            if paths:
+                growth=fitGrowth(np.bincount(dist.astype(int)),num_nodes)
+                if growth is not None:
+                    gamma+=growth
+                    num_gamma+=1
+                num_paths += num_nodes-1-p
+                path_len += dist[p+1:].sum()
+            near = candidates[:num_cand][dist[candidates[:num_cand]] <= el]
+            num_cand = len(near)
+            candidates[:num_cand] = near
+            uncovered[p] = False
+            num_uncovered -= 1
+            if progress is not None:
+                progress.step(el, num_nodes-num_uncovered, int(paths))
         boxes+=1
+    if paths:
+        return boxes,gamma,num_gamma,num_paths,path_len
     return boxes
 
 
+### ~~~~~~ Box covering progress. Every node is a box center once per box size, so the run makes
+### ~~~~~~ num_nodes BFS for each scheduled box size and the ETA follows from the BFS rate.
+class Progress:
+    def __init__(self, num_nodes, diameter, num_sizes, interval, status=None):
+        self.num_nodes = num_nodes
+        self.max_size = diameter-1
+        self.total = num_nodes*num_sizes
+        self.interval = interval
+        self.status = status
+        self.bfs = 0
+        self.fits = 0
+        self.start = time.time()
+        self.last = self.start
+
+    ### ~~~~~~ Count BFS and their fits, reporting if the interval has passed
+    def step(self, box_size, covered, fits=0, bfs=1):
+        self.bfs += bfs
+        self.fits += fits
+        now = time.time()
+        if now-self.last >= self.interval:
+            self.last = now
+            self.report(box_size, covered)
+
+    def report(self, box_size, covered):
+        elapsed = max(time.time()-self.start, 1e-9)
+        rate = self.bfs/elapsed
+        eta = (self.total-self.bfs)/rate if rate > 0 else float('inf')
+        line = ('Box size %d/%d : covered %d, uncovered %d, %.1f BFS/s, %.1f fits/s, elapsed %s, ETA %s'
+                % (box_size, self.max_size, covered, self.num_nodes-covered, rate, self.fits/elapsed,
+                   formatSeconds(elapsed), formatSeconds(eta)))
+        if self.status:
+            with open(self.status, 'w') as f:
+                f.write(line + '\n')
+        else:
+            print(line, file=sys.stderr, flush=True)
+
+
+def formatSeconds(seconds):
+    if seconds == float('inf'):
+        return 'unknown'
+    seconds = int(seconds)
+    return '%d:%02d:%02d' % (seconds//3600, seconds//60 % 60, seconds % 60)
+
+
+### ~~~~~~ Peak resident memory in MB of this process or of the largest of its finished worker
+### ~~~~~~ processes, started for -cores by the path length pass, the components and bz2 decompression
+def peakMemory():
+    return max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)/1024
+
+
+### ~~~~~~ CPU seconds used so far, on entering main the interpreter start up and module imports
+def startupTime():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
 if __name__ == '__main__':
     main()
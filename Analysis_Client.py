@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+import json
+import os
+import socket
+import sys
+from Analysis import ANALYZER_OPTIONS, METRICS, analysisParser, printResults
+
+# Client of the local analysis server
+#
+# Authors:
+#           Miko Stulajter
+#
+# Version 1.0.0
+#
+# Takes the options of Analysis.py, sends them as a job to Analysis_Server.py and prints the
+# results the same way. Results are cached by the server instead of the store.
+#
+
+def argParsing():
+    parser = analysisParser(client=True)
+    parser.description = 'Send an analysis job to a running Analysis_Server.py and report the results.'
+
+    parser.add_argument('-socket',
+    help="Unix socket of the server (Default is 'analysis.sock').",
+    dest='socket',
+    default='analysis.sock',
+    type=str,
+    required=False)
+
+    parser.add_argument('-graph',
+    help='Id of a graph the server loaded for an earlier job, instead of -file.',
+    dest='graph',
+    type=str,
+    required=False)
+
+    parser.add_argument('-metrics',
+    help='Metrics to compute, printed as JSON (Default is all of them).',
+    dest='metrics',
+    nargs='+',
+    choices=METRICS,
+    required=False)
+
+    parser.add_argument('-json',
+    help='Print the reply of the server as JSON.',
+    dest='json',
+    action='store_true',
+    required=False)
+
+    args = parser.parse_args()
+    if (args.file is None) == (args.graph is None):
+        parser.error("Give either -file or -graph.")
+    return args
+
+
+def main():
+    ### ~~~~~~ Argument parsing
+    args = argParsing()
+
+    ### ~~~~~~ Job with every analysis option, paths made absolute for the server
+    job = {key: getattr(args, key) for key in ['cores', 'seed', 'backend', 'lattice', 'metrics'] + list(ANALYZER_OPTIONS)}
+    if args.file:
+        job['file'] = os.path.abspath(args.file)
+    else:
+        job['graph'] = args.graph
+    if args.status:
+        job['status'] = os.path.abspath(args.status)
+
+    ### ~~~~~~ Send and print the reply
+    reply = request(args.socket, job)
+    if 'error' in reply:
+        sys.exit('Analysis server error : ' + reply['error'])
+    if args.json or args.metrics:
+        print(json.dumps(reply, indent=1))
+    else:
+        printResults(reply['results'])
+        if 'graph' in reply:
+            print('Graph id : ' + reply['graph'])
+
+
+### ~~~~~~ Send one job or command to the server and return its reply
+def request(path, job):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        sock.sendall((json.dumps(job) + '\n').encode())
+        with sock.makefile('rb') as reply:
+            return json.loads(reply.readline())
+
+
+if __name__ == '__main__':
+    main()
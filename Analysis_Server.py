@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+import argparse
+import hashlib
+import json
+import os
+import socketserver
+import stat
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from Analysis import ANALYZER_OPTIONS, METRICS, NetworkAnalyzer, closedForms, nk, readEdges
+
+# Local analysis server that keeps imports and loaded graphs warm
+#
+# Authors:
+#           Miko Stulajter
+#
+# Version 1.0.2
+#
+# Jobs are sent over a Unix socket as one JSON line each and answered with one JSON line. A job
+# names a network file, or the id of a graph loaded by an earlier job, the metrics to compute,
+# all of them by default, and the options of Analysis.py:
+#
+#     {"file": "/data/RL-P_L10_d-3.netbin", "seed": 1, "metrics": ["frac_dim"]}
+#     {"graph": "5d0c1e2f9a3b7c4d", "results": {"network": "RL-P_L10_d-3.netbin", "frac_dim": 2.9}}
+#
+# Loaded graphs and their analyzers, with the intermediates they memoized, are kept in LRU
+# caches. Jobs run on a bounded pool of worker threads and {"command": "stats"} or
+# {"command": "shutdown"} inspect or stop the server. Analysis_Client.py sends jobs from the
+# command line.
+#
+
+def argParsing():
+    parser = argparse.ArgumentParser(description='Serve network analysis jobs on a Unix socket, keeping loaded graphs in memory.')
+
+    parser.add_argument('-socket',
+    help="Unix socket the server listens on (Default is 'analysis.sock').",
+    dest='socket',
+    default='analysis.sock',
+    type=str,
+    required=False)
+
+    parser.add_argument('-workers',
+    help='Number of jobs run at the same time (Default is 1).',
+    dest='workers',
+    default=1,
+    type=int,
+    required=False)
+
+    parser.add_argument('-cores',
+    help="Number of networkit threads, shared by all jobs as networkit sets them process wide. A job's cores set its worker processes (Default is 1).",
+    dest='cores',
+    default=1,
+    type=int,
+    required=False)
+
+    parser.add_argument('-cache',
+    help='Number of loaded graphs, and of analyzers per seed and options, kept in memory (Default is 4).',
+    dest='cache',
+    default=4,
+    type=int,
+    required=False)
+
+    args = parser.parse_args()
+    if args.workers < 1 or args.cache < 1 or args.cores < 1:
+        parser.error("-workers, -cores and -cache must be positive.")
+    return args
+
+
+def main():
+    ### ~~~~~~ Argument parsing
+    args = argParsing()
+
+    ### ~~~~~~ Serve until shut down
+    warmImports()
+    nk.setNumberOfThreads(args.cores)
+    server = AnalysisServer(args.socket, args.workers, args.cache, args.cores)
+    print("Serving on " + args.socket + " with %d workers" % args.workers, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.pool.shutdown()
+        os.unlink(args.socket)
+
+
+### ~~~~~~ Import what Analysis.py defers to its first analysis
+def warmImports():
+    nk.Graph
+    import scipy.optimize
+    import scipy.sparse.csgraph
+
+
+### ~~~~~~ Keys a job may have
+JOB_KEYS = {'file', 'graph', 'metrics', 'cores', 'seed', 'backend', 'lattice'} | set(ANALYZER_OPTIONS)
+
+
+### ~~~~~~ Least recently used cache of at most size values, loaded by load(key) when missing
+class LRUCache:
+    def __init__(self, size):
+        self.size = size
+        self.items = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key, load=None):
+        with self.lock:
+            if key in self.items:
+                self.items.move_to_end(key)
+                return self.items[key]
+        if load is None:
+            raise KeyError(key)
+        value = load(key)
+        with self.lock:
+            if key in self.items:
+                return self.items[key]
+            self.items[key] = value
+            while len(self.items) > self.size:
+                self.items.popitem(last=False)
+        return value
+
+    def keys(self):
+        with self.lock:
+            return list(self.items)
+
+
+class AnalysisServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path, workers, cache, cores=1):
+        if os.path.exists(path) and stat.S_ISSOCK(os.stat(path).st_mode):
+            os.unlink(path)
+        super().__init__(path, JobHandler)
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+        self.graphs = LRUCache(cache)
+        self.analyzers = LRUCache(cache)
+        self.ids = {}
+        self.cores = cores
+
+    ### ~~~~~~ Answer one job or command
+    def run(self, job):
+        command = job.get('command')
+        if command == 'stats':
+            return {'graphs': {gid: self.ids[gid] for gid in self.graphs.keys()},
+                    'analyzers': len(self.analyzers.keys())}
+        if command == 'shutdown':
+            threading.Thread(target=self.shutdown).start()
+            return {'shutdown': True}
+        if command is not None:
+            raise ValueError('Unknown command ' + str(command) + ', use stats or shutdown.')
+        return self.pool.submit(self.analyze, job).result()
+
+    ### ~~~~~~ Run an analysis job, returns the graph id and the requested results
+    def analyze(self, job):
+        unknown = set(job) - JOB_KEYS
+        if unknown:
+            raise ValueError('Unknown job keys: ' + ', '.join(sorted(unknown)))
+        metrics = job.get('metrics') or None
+        if metrics is not None and not set(metrics) <= set(METRICS):
+            raise ValueError('Unknown metrics: ' + ', '.join(sorted(set(metrics) - set(METRICS))))
+        if ('file' in job) == ('graph' in job):
+            raise ValueError('A job names either a file or a graph id.')
+        cores = int(job.get('cores', 1))
+        seed = job.get('seed')
+
+        ### ~~~~~~ Closed forms of unrewired lattices, which the analytic backend answers without a graph
+        closed = None
+        if 'file' in job:
+            backend = job.get('backend', 'auto')
+            closed = closedForms(job['file'], backend, job.get('lattice'))
+            if backend == 'analytic':
+                return {'results': select(closed, metrics)}
+            gid = self.graphId(job['file'])
+        else:
+            gid = job['graph']
+        name, H = self.loadGraph(gid)
+
+        ### ~~~~~~ Analyzer of the graph with the job's seed and options, every analyzer draws from its
+        ### ~~~~~~ own random generators and computes one job at a time
+        options = {key: job[key] for key in ANALYZER_OPTIONS if key in job}
+        key = (gid, cores, seed, json.dumps(options, sort_keys=True), closed is not None)
+        analyzer, lock = self.analyzers.get(key, lambda key: (self.analyzer(H, name, cores, seed, options, closed), threading.Lock()))
+        with lock:
+            results = analyzer.results() if metrics is None else select(analyzer, metrics)
+        return {'graph': gid, 'results': results}
+
+    ### ~~~~~~ New analyzer, taking the closed forms of a lattice if given
+    def analyzer(self, H, name, cores, seed, options, closed=None):
+        analyzer = NetworkAnalyzer(H, name, cores, seed, **options)
+        if closed is not None:
+            analyzer.useKnown(closed)
+        return analyzer
+
+    ### ~~~~~~ Id of a network file, which changes when the file does
+    def graphId(self, file):
+        path = os.path.realpath(file)
+        info = os.stat(path)
+        gid = hashlib.sha256(json.dumps([path, info.st_mtime_ns, info.st_size]).encode()).hexdigest()[:16]
+        self.ids[gid] = path
+        return gid
+
+    ### ~~~~~~ (network name, graph) of a graph id, read on a miss
+    def loadGraph(self, gid):
+        if gid not in self.ids:
+            raise ValueError('Unknown graph id ' + gid + ', send the file instead.')
+        def load(gid):
+            path = self.ids[gid]
+            num_nodes, src, tar = readEdges(path)
+            return os.path.basename(path), NetworkAnalyzer.fromEdges(num_nodes, src, tar, cores=self.cores, lowmem=True).H
+        return self.graphs.get(gid, load)
+
+
+### ~~~~~~ Network name and the requested metrics of an analyzer or a results dictionary
+def select(source, metrics):
+    if isinstance(source, dict):
+        return source if metrics is None else dict(network=source['network'], **{m: source[m] for m in metrics})
+    return dict(network=source.network, **{m: getattr(source, m) for m in metrics})
+
+
+### ~~~~~~ Read JSON lines and answer each with a JSON line
+class JobHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                reply = self.server.run(json.loads(line))
+            except Exception as e:
+                reply = {'error': type(e).__name__ + ': ' + str(e)}
+            self.wfile.write((json.dumps(reply) + '\n').encode())
+            self.wfile.flush()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+import numpy as np
+
+# Counter-based random numbers shared by the generation scripts
+#
+# Authors:
+#           Miko Stulajter
+#
+# Version 1.0.0
+#
+# Every draw is a pure function of (seed, stream, index, attempt), so a network does not depend on
+# the order, chunking or process its edges are generated in.
+#
+
+PHILOX_M0 = np.uint64(0xD2511F53)
+PHILOX_M1 = np.uint64(0xCD9E8D57)
+PHILOX_W0 = np.uint64(0x9E3779B9)
+PHILOX_W1 = np.uint64(0xBB67AE85)
+MASK32 = np.uint64(0xFFFFFFFF)
+
+### ~~~~~~ Streams of the draws made for one edge
+STREAM_REWIRE = 0
+STREAM_TARGET = 1
+
+
+### ~~~~~~ Philox4x32-10 block function on arrays of 32 bit counter words and a 64 bit key
+def philox4x32(c0, c1, c2, c3, key):
+    c0, c1, c2, c3 = (np.asarray(c, dtype=np.uint64) & MASK32 for c in (c0, c1, c2, c3))
+    k0 = np.uint64(key & 0xFFFFFFFF)
+    k1 = np.uint64((key >> 32) & 0xFFFFFFFF)
+    for r in range(10):
+        if r:
+            k0 = (k0 + PHILOX_W0) & MASK32
+            k1 = (k1 + PHILOX_W1) & MASK32
+        p0 = PHILOX_M0 * c0
+        p1 = PHILOX_M1 * c2
+        c0, c1, c2, c3 = (p1 >> np.uint64(32)) ^ c1 ^ k0, p1 & MASK32, (p0 >> np.uint64(32)) ^ c3 ^ k1, p0 & MASK32
+    return c0, c1, c2, c3
+
+
+### ~~~~~~ Uniform doubles in [0, 1) for every index, keyed by seed, stream and attempt
+def uniform(seed, stream, index, attempt=0):
+    index = np.asarray(index, dtype=np.uint64)
+    w0, w1, w2, w3 = philox4x32(index, index >> np.uint64(32), stream, attempt, seed)
+    return ((w0 >> np.uint64(5)) * np.uint64(1 << 26) + (w1 >> np.uint64(6))) / float(1 << 53)
+
+
+### ~~~~~~ Uniform integers in 0..n-1 for every index, keyed by seed, stream and attempt
+def integers(seed, stream, index, n, attempt=0):
+    return np.minimum((uniform(seed, stream, index, attempt) * n).astype(np.int64), n-1)
+
+
+### ~~~~~~ NumPy Philox generator for block b of a seed, each block owning its own counter range
+def block_rng(seed, b, stream=0):
+    return np.random.Generator(np.random.Philox(key=seed + (stream << 64), counter=b << 128))
@@ -0,0 +1,144 @@
+import numpy as np
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from Counter_RNG import block_rng
+
+# Ensemble helpers shared by the generation scripts
+#
+# Authors:
+#           Miko Stulajter
+#
+# Version 1.0.1
+#
+
+### ~~~~~~ Add the replica, seed and jobs arguments to a generator's parser
+def add_ensemble_args(parser):
+    parser.add_argument('-replicas',
+    help="Number of independent realizations to generate (Default is 1).",
+    dest='replicas',
+    default=1,
+    type=int,
+    required=False)
+
+    parser.add_argument('-seed',
+    help="Base random seed, replica r uses a seed derived from it and r (Default is random).",
+    dest='seed',
+    default=None,
+    type=int,
+    required=False)
+
+    parser.add_argument('-jobs',
+    help="Number of processes used to generate replicas, or the blocks of a single network (Default is 1).",
+    dest='jobs',
+    default=1,
+    type=int,
+    required=False)
+
+
+### ~~~~~~ Deterministic seed of every replica, independent of the number of replicas and jobs
+def replica_seeds(seed, replicas):
+    children = np.random.SeedSequence(seed).spawn(replicas)
+    return [int(child.generate_state(1, np.uint64)[0]) for child in children]
+
+
+### ~~~~~~ Output file name of every replica
+def replica_names(base, ext, seed, replicas):
+    if seed is not None:
+        base += "_seed-" + str(seed)
+    if replicas == 1:
+        return [base + ext]
+    return [base + "_rep-" + str(r) + ext for r in range(replicas)]
+
+
+### ~~~~~~ Generate all replicas with generate(args, filename, seed), in a process pool if jobs > 1
+### ~~~~~~ An explicit output file name is kept as given apart from the replica suffix
+def run_ensemble(generate, args, base, ext):
+    seeds = replica_seeds(args.seed, args.replicas)
+    names = replica_names(base, ext, None if args.ofile else args.seed, args.replicas)
+    if args.jobs > 1 and args.replicas > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            list(pool.map(generate, [args]*args.replicas, names, seeds))
+    else:
+        for filename, seed in zip(names, seeds):
+            generate(args, filename, seed)
+    return names
+
+
+### ~~~~~~ Expected number of sampled edges per block of a packed edge id space
+BLOCK_EDGES = 1 << 22
+
+
+### ~~~~~~ Boundaries of the blocks an id space of the given size is split into for m samples
+def block_bounds(size, m):
+    num_blocks = max(1, -(-m // BLOCK_EDGES))
+    return [size*b // num_blocks for b in range(num_blocks+1)]
+
+
+### ~~~~~~ (seed, block, lo, hi, count) of every block for exactly m distinct ids from 0..size-1
+def exact_block_tasks(seed, size, m):
+    bounds = block_bounds(size, m)
+    sizes = [bounds[b+1]-bounds[b] for b in range(len(bounds)-1)]
+    counts = split_counts(block_rng(seed, 0, stream=1), sizes, m)
+    return [(seed, b, bounds[b], bounds[b+1], int(counts[b])) for b in range(len(sizes))]
+
+
+### ~~~~~~ Lazily map func over argument tuples in order, keeping at most 2*jobs blocks in flight
+def map_blocks(func, tasks, jobs):
+    if jobs <= 1:
+        for task in tasks:
+            yield func(*task)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = deque()
+        for task in tasks:
+            pending.append(pool.submit(func, *task))
+            if len(pending) > 2*jobs:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+### ~~~~~~ Split m draws without replacement over consecutive ranges of the given sizes
+def split_counts(rng, sizes, m):
+    counts = np.zeros(len(sizes), dtype=np.int64)
+    remaining = int(sum(sizes))
+    for b, size in enumerate(sizes[:-1]):
+        remaining -= size
+        if m == 0:
+            break
+        # Exact hypergeometric split where numpy supports it, binomial approximation beyond 1e9
+        if size < 10**9 and remaining < 10**9:
+            counts[b] = rng.hypergeometric(size, remaining, m) if remaining > 0 else m
+        else:
+            counts[b] = min(rng.binomial(m, size/(size+remaining)), size)
+        m -= counts[b]
+    counts[-1] = m
+    return counts
+
+
+### ~~~~~~ Sorted distinct values, sort based which is faster than np.unique on large int arrays
+def sorted_unique(values):
+    values = np.sort(values)
+    if len(values) == 0:
+        return values
+    return values[np.concatenate(([True], values[1:] != values[:-1]))]
+
+
+### ~~~~~~ Sorted sample of m distinct integers from lo..hi-1
+def sample_distinct(rng, lo, hi, m):
+    size = hi - lo
+    if m == 0:
+        return np.empty(0, dtype=np.int64)
+    if m > size // 2:
+        # Dense sample, draw the complement instead
+        drop = sample_distinct(rng, 0, size, size - m)
+        keep = np.ones(size, dtype=bool)
+        keep[drop] = False
+        return lo + np.flatnonzero(keep)
+    ids = sorted_unique(rng.integers(0, size, size=m))
+    while len(ids) < m:
+        extra = rng.integers(0, size, size=int((m-len(ids))*1.1)+16)
+        ids = sorted_unique(np.concatenate((ids, extra)))
+    if len(ids) > m:
+        ids = np.sort(rng.choice(ids, m, replace=False))
+    return lo + ids
@@ -1,30 +1,32 @@
 #!/usr/bin/env python3
-import networkx as nx
-import bz2
+import numpy as np
 import argparse
+from Network_IO import OUTPUT_EXT, write_network
+from Ensemble import add_ensemble_args, run_ensemble, exact_block_tasks, map_blocks, sample_distinct
+from Counter_RNG import block_rng
 
-# Generate a bipartite random network 
+# Generate a bipartite random network
 #
 # Authors:
 #           Miko Stulajter
 #
-# Version 1.0.0
+# Version 1.2.0
 #
 
-def argParsing():
+def argParsing(argv=None):
     parser = argparse.ArgumentParser(description='Generate a bipartite random network.')
-    
+
     parser.add_argument('-N',
-        help="Number of total nodes.",
+        help="Number of total nodes (not used with degree sequences).",
         dest='N',
         type=int,
-        required=True)
+        required=False)
 
     parser.add_argument('-E',
-        help="Number of edges.",
+        help="Number of edges (not used with degree sequences).",
         dest='E',
         type=int,
-        required=True)
+        required=False)
 
     parser.add_argument('-pM',
         help="Percentage of nodes in first bipartite set (Default is 0.5).",
@@ -33,36 +35,94 @@ def argParsing():
         default=0.5,
         required=False)
 
+    parser.add_argument('-deg1',
+        help="File with the degree sequence of the first bipartite set for a bipartite configuration model.",
+        dest='deg1',
+        type=str,
+        required=False)
+
+    parser.add_argument('-deg2',
+        help="File with the degree sequence of the second bipartite set for a bipartite configuration model.",
+        dest='deg2',
+        type=str,
+        required=False)
+
     parser.add_argument('-ofile',
-        help="Output file name with no extension as it will be saved as a '.graphml.bz2' file.",
+        help="Output file name with no extension as it will be saved as a '.graphml.bz2' or '.netbin' file.",
         dest='ofile',
         type=str,
         required=False)
 
-    return parser.parse_args()
+    parser.add_argument('-format',
+        help="Output format either 'graphml' or 'binary' (Default is graphml).",
+        dest='format',
+        choices=['graphml', 'binary'],
+        default='graphml',
+        required=False)
+
+    add_ensemble_args(parser)
+
+    args = parser.parse_args(argv)
+    if (args.deg1 is None) != (args.deg2 is None):
+        parser.error("-deg1 and -deg2 must be given together.")
+    if args.deg1 is None and (args.N is None or args.E is None):
+        parser.error("-N and -E are required without degree sequences.")
+    return args
 
 
 def main():
     ### ~~~~~~ Argument parsing
     args = argParsing()
 
-    ### ~~~~~~ Number of nodes in bipartite sets
-    sN=int(args.N*args.pM)
-    sM=args.N-sN
+    ### ~~~~~~ Generate all replicas
+    if (args.ofile):
+        base=args.ofile
+    elif args.deg1:
+        base="BR-CM_"+args.deg1.rsplit('/', 1)[-1].rsplit('.', 1)[0]+"_"+args.deg2.rsplit('/', 1)[-1].rsplit('.', 1)[0]
+    else:
+        base="BR_N-"+str(args.N)+"_E-"+str(args.E)+"_pM-"+str(args.pM)
+    run_ensemble(generate, args, base, OUTPUT_EXT[args.format])
 
-    ### ~~~~~~ Generate network
-    G = nx.bipartite.gnmk_random_graph(sN,sM,args.E)
 
-    ### ~~~~~~ Output network
-    if (args.ofile):
-        filename=args.ofile+'.graphml.bz2'
+def generate(args, filename, seed):
+    ### ~~~~~~ Bipartite configuration model from degree sequences
+    if args.deg1:
+        deg1=np.loadtxt(args.deg1,dtype=np.int64,ndmin=1)
+        deg2=np.loadtxt(args.deg2,dtype=np.int64,ndmin=1)
+        if deg1.sum() != deg2.sum():
+            raise ValueError("Degree sequences of the bipartite sets must have the same sum.")
+        sN=len(deg1)
+        sM=len(deg2)
+        edge_chunks=[configuration_edges(block_rng(seed,0),deg1,deg2)]
+        meta={'model': 'BR-CM', 'E': int(deg1.sum()), 'sN': sN, 'seed': seed}
+
+    ### ~~~~~~ Exactly E distinct edges, packed as u*sM + v, split into seeded blocks
     else:
-        filename="BR_N-"+str(args.N)+"_E-"+str(args.E)+"_pM-"+str(args.pM)+'.graphml.bz2'
+        sN=int(args.N*args.pM)
+        sM=args.N-sN
+        tasks=exact_block_tasks(seed,sN*sM,min(args.E,sN*sM))
+        jobs=args.jobs if args.replicas == 1 else 1
+        edge_chunks=map_blocks(gnmk_block,[task+(sN,sM) for task in tasks],jobs)
+        meta={'model': 'BR', 'N': args.N, 'E': args.E, 'pM': args.pM, 'sN': sN, 'seed': seed}
 
-    with bz2.open(filename, 'wb') as f:
-        nx.write_graphml(G, f)
+    ### ~~~~~~ Output network, nodes 0..sN-1 form the first bipartite set
+    write_network(filename, args.format, sN+sM, edge_chunks, meta,
+                  [('bipartite', 'long', lambda ids: (ids >= sN).astype(np.int64))])
+
+
+### ~~~~~~ Block of m distinct packed (u, v) pairs in lo..hi-1
+def gnmk_block(seed,b,lo,hi,m,sN,sM):
+    k=sample_distinct(block_rng(seed,b),lo,hi,m)
+    return k//sM,sN+k%sM
+
+
+### ~~~~~~ Random matching of the stubs of both sets, multi-edges are kept as in networkx
+def configuration_edges(rng,deg1,deg2):
+    src=np.repeat(np.arange(len(deg1)),deg1)
+    tar=len(deg1)+np.repeat(np.arange(len(deg2)),deg2)
+    rng.shuffle(tar)
+    return src,tar
 
 
 if __name__ == '__main__':
     main()
-
@@ -1,19 +1,21 @@
 #!/usr/bin/env python3
-import networkx as nx
-import bz2
+import numpy as np
 import argparse
+from Network_IO import OUTPUT_EXT, write_network
+from Ensemble import add_ensemble_args, run_ensemble, block_bounds, exact_block_tasks, map_blocks, sample_distinct
+from Counter_RNG import block_rng
 
-# Generate an Erdős-Rényi network 
+# Generate an Erdős-Rényi network
 #
 # Authors:
 #           Miko Stulajter
 #
-# Version 1.0.0
+# Version 1.2.0
 #
 
-def argParsing():
+def argParsing(argv=None):
     parser = argparse.ArgumentParser(description='Generate an Erdős-Rényi network.')
-    
+
     parser.add_argument('-N',
         help="Number of total nodes.",
         dest='N',
@@ -21,40 +23,99 @@ def argParsing():
         required=True)
 
     parser.add_argument('-E',
-        help="Approximate number of edges desired.",
+        help="Number of edges desired, approximate for 'gnp' and exact for 'gnm'.",
         dest='E',
         type=int,
         required=True)
 
+    parser.add_argument('-mode',
+        help="Either 'gnp' with edge probability E/(N(N-1)/2) or 'gnm' with exactly E edges (Default is gnp).",
+        dest='mode',
+        choices=['gnp', 'gnm'],
+        default='gnp',
+        required=False)
+
     parser.add_argument('-ofile',
-        help="Output file name with no extension as it will be saved as a '.graphml.bz2' file.",
+        help="Output file name with no extension as it will be saved as a '.graphml.bz2' or '.netbin' file.",
         dest='ofile',
         type=str,
         required=False)
 
-    return parser.parse_args()
+    parser.add_argument('-format',
+        help="Output format either 'graphml' or 'binary' (Default is graphml).",
+        dest='format',
+        choices=['graphml', 'binary'],
+        default='graphml',
+        required=False)
+
+    add_ensemble_args(parser)
+
+    return parser.parse_args(argv)
 
 
 def main():
     ### ~~~~~~ Argument parsing
     args = argParsing()
 
-    ### ~~~~~~ Edge creation probability
-    eP=args.E/((args.N*(args.N-1))/2)
+    ### ~~~~~~ Generate all replicas
+    if (args.ofile):
+        base=args.ofile
+    elif args.mode == 'gnm':
+        base="ER_N-"+str(args.N)+"_E-"+str(args.E)+"_mode-gnm"
+    else:
+        base="ER_N-"+str(args.N)+"_E-"+str(args.E)
+    run_ensemble(generate, args, base, OUTPUT_EXT[args.format])
 
-    ### ~~~~~~ Generate network
-    G = nx.erdos_renyi_graph(args.N,eP)
 
-    ### ~~~~~~ Output network
-    if (args.ofile):
-        filename=args.ofile+'.graphml.bz2'
+def generate(args, filename, seed):
+    ### ~~~~~~ Node pairs are packed as k = v(v-1)/2 + u for u < v, split into blocks with their own Philox counter range
+    num_pairs=args.N*(args.N-1)//2
+    E=min(args.E,num_pairs)
+
+    ### ~~~~~~ Edge creation probability or exact number of edges per block
+    if args.mode == 'gnp':
+        eP=E/num_pairs if num_pairs else 0
+        bounds=block_bounds(num_pairs,E)
+        tasks=[(seed,b,bounds[b],bounds[b+1],eP) for b in range(len(bounds)-1)]
+        block=gnp_block
     else:
-        filename="ER_N-"+str(args.N)+"_E-"+str(args.E)+'.graphml.bz2'
+        tasks=exact_block_tasks(seed,num_pairs,E)
+        block=gnm_block
+
+    ### ~~~~~~ Generate and output network, blocks run in parallel when only one replica is made
+    jobs=args.jobs if args.replicas == 1 else 1
+    meta={'model': 'ER', 'N': args.N, 'E': args.E, 'mode': args.mode, 'seed': seed}
+    write_network(filename, args.format, args.N, map_blocks(block, tasks, jobs), meta)
+
+
+### ~~~~~~ Node pairs (u, v) of packed pair ids
+def unpack_pairs(k):
+    v=((1+np.sqrt(1+8*k.astype(float)))//2).astype(np.int64)
+    v-=v*(v-1)//2 > k
+    v+=(v+1)*v//2 <= k
+    return k-v*(v-1)//2,v
 
-    with bz2.open(filename, 'wb') as f:
-        nx.write_graphml(G, f)
+
+### ~~~~~~ G(n,p) block: geometric skips between successive sampled pair ids in lo..hi-1
+def gnp_block(seed,b,lo,hi,eP):
+    rng=block_rng(seed,b)
+    if eP <= 0:
+        return unpack_pairs(np.empty(0,dtype=np.int64))
+    ids=[]
+    pos=lo-1
+    batch=int((hi-lo)*eP*1.05+16)
+    while pos < hi:
+        skips=pos+np.cumsum(rng.geometric(eP,size=batch))
+        ids.append(skips[skips < hi])
+        pos=skips[-1]
+        batch=max(16,int((hi-pos)*eP*1.05))
+    return unpack_pairs(np.concatenate(ids))
+
+
+### ~~~~~~ G(n,m) block: m distinct pair ids in lo..hi-1
+def gnm_block(seed,b,lo,hi,m):
+    return unpack_pairs(sample_distinct(block_rng(seed,b),lo,hi,m))
 
 
 if __name__ == '__main__':
     main()
-
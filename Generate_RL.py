@@ -1,19 +1,20 @@
 #!/usr/bin/env python3
-import networkx as nx
-import bz2
 import argparse
-import random
-import copy
+import itertools
+import numpy as np
+from Network_IO import CHUNK_NODES, OUTPUT_EXT, int_digits, format_nodes, format_edges, graphml_key, write_graphml_parallel, write_binary, coordinates_name
+from Ensemble import add_ensemble_args, run_ensemble
+from Counter_RNG import STREAM_REWIRE, STREAM_TARGET, uniform, integers
 
 # Generate a lattice network 
 #
 # Authors:
 #           Miko Stulajter
 #
-# Version 1.2.0
+# Version 1.7.1
 #
 
-def argParsing():
+def argParsing(argv=None):
     parser = argparse.ArgumentParser(description='Generate a lattice network.')
 
     parser.add_argument('-l1',
@@ -23,13 +24,13 @@ def argParsing():
     required=True)
 
     parser.add_argument('-d',
-    help="Number of dimensions (up to 5 for bc=2 or rP>0).",
+    help="Number of dimensions.",
     dest='d',
     type=int,
     required=True)
 
     parser.add_argument('-bc',
-    help="Boundary condition type either '1: periodic' or '2: non-periodic' (Default : 1).",
+    help="Boundary condition type either '1: non-periodic' or '2: periodic' (Default : 1).",
     dest='bc',
     type=check_bc,
     default=1,
@@ -43,12 +44,38 @@ def argParsing():
     required=False)
 
     parser.add_argument('-ofile',
-    help="Output file name with no extension as it will be saved as a '.graphml.bz2' file.",
+    help="Output file name with no extension as it will be saved as a '.graphml.bz2' or '.netbin' file.",
     dest='ofile',
     type=str,
     required=False)
 
-    return parser.parse_args()
+    parser.add_argument('-format',
+    help="Output format either 'graphml' or 'binary' (Default : graphml).",
+    dest='format',
+    choices=['graphml', 'binary'],
+    default='graphml',
+    required=False)
+
+    parser.add_argument('-ids',
+    help="GraphML node ids either 'coord' for coordinate strings '(i, j, ...)' or 'int' for ids 0..L^d-1 (Default : coord).",
+    dest='ids',
+    choices=['coord', 'int'],
+    default='coord',
+    required=False)
+
+    parser.add_argument('-coords',
+    help="Node coordinates with integer ids either 'none', 'data' for GraphML node attributes 'coord0'.. or 'sidecar' for a '_coords.npy' array (Default : none).",
+    dest='coords',
+    choices=['none', 'data', 'sidecar'],
+    default='none',
+    required=False)
+
+    add_ensemble_args(parser)
+
+    args = parser.parse_args(argv)
+    if args.coords == 'data' and args.ids == 'coord':
+        parser.error("-coords data requires -ids int.")
+    return args
 
 
 def check_bc(i_v):
@@ -61,1437 +88,195 @@ def check_bc(i_v):
 def main():
     ### ~~~~~~ Argument parsing
     args = argParsing()
+    periodic = args.bc == 2
 
-    ### ~~~~~~ Generate network if non-periodic and rewiring probability is zero
-    if args.bc == 1 and args.rp == 0:
-        d_list=(args.l1,) * args.d
-        G = nx.grid_graph(dim=d_list)
-
-        ### ~~~~~~ Output network
-        if (args.ofile):
-            filename=args.ofile+'.graphml.bz2'
-        else:
-            filename="RL-NP_L"+str(args.l1)+"_d-"+str(args.d)+'.graphml.bz2'
-        with bz2.open(filename, 'wb') as f:
-            nx.write_graphml(G, f)
-
-    ### ~~~~~~ Generate network if non-periodic and rewiring probability is nonzero
-    elif args.bc == 1 and args.rp != 0:
-        if (args.ofile):
-            filename=args.ofile+'.graphml.bz2'
-        else:
-            filename="RL-NP_R-"+str(args.rp)+"_L"+str(args.l1)+"_d-"+str(args.d)+'.graphml.bz2'
-        if args.d == 1:
-            generate_1D_NP_RP(filename,args.l1,args.rp)
-        elif  args.d == 2:
-            generate_2D_NP_RP(filename,args.l1,args.rp)
-        elif  args.d == 3:
-            generate_3D_NP_RP(filename,args.l1,args.rp)
-        elif  args.d == 4:
-            generate_4D_NP_RP(filename,args.l1,args.rp)
-        elif  args.d == 5:
-            generate_5D_NP_RP(filename,args.l1,args.rp)
-        else:
-            print("Not a valid dimension for non-periodic boundary conditions with a rewiring probability. Only a value of 1,2,3,5, and 5 are valid.")
-
-    ### ~~~~~~ Generate network if periodic and rewiring probability is zero
-    elif args.bc == 2 and args.rp == 0:
-        if (args.ofile):
-            filename=args.ofile+'.graphml.bz2'
-        else:
-            filename="RL-P_L"+str(args.l1)+"_d-"+str(args.d)+'.graphml.bz2'
-        if args.d == 1:
-            generate_1D_P(filename,args.l1)
-        elif  args.d == 2:
-            generate_2D_P(filename,args.l1)
-        elif  args.d == 3:
-            generate_3D_P(filename,args.l1)
-        elif  args.d == 4:
-            generate_4D_P(filename,args.l1)
-        elif  args.d == 5:
-            generate_5D_P(filename,args.l1)
-        else:
-            print("Not a valid dimension for periodic boundary conditions. Only a value of 1,2,3,4, and 5 are valid.")
-
-    ### ~~~~~~ Generate network if periodic and rewiring probability is nonzero
+    ### ~~~~~~ Generate all replicas
+    if (args.ofile):
+        base=args.ofile
+    elif args.rp == 0:
+        base="RL-"+("P" if periodic else "NP")+"_L"+str(args.l1)+"_d-"+str(args.d)
     else:
-        if (args.ofile):
-            filename=args.ofile+'.graphml.bz2'
-        else:
-            filename="RL-P_R-"+str(args.rp)+"_L"+str(args.l1)+"_d-"+str(args.d)+'.graphml.bz2'
-        if args.d == 1:
-            generate_1D_P_RP(filename,args.l1,args.rp)
-        elif  args.d == 2:
-            generate_2D_P_RP(filename,args.l1,args.rp)
-        elif  args.d == 3:
-            generate_3D_P_RP(filename,args.l1,args.rp)
-        elif  args.d == 4:
-            generate_4D_P_RP(filename,args.l1,args.rp)
-        elif  args.d == 5:
-            generate_5D_P_RP(filename,args.l1,args.rp)
-        else:
-            print("Not a valid dimension for periodic boundary conditions with a rewiring probability. Only a value of 1,2,3,4, and 5 are valid.")
-
-
-def generate_1D_P(filename,N):
-    Nm1=N-1
-    with bz2.open(filename, 'wt') as f:
-        f.write("<?xml version='1.0' encoding='utf-8'?>\n")
-        f.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">\n')
-        f.write('  <graph edgedefault="undirected">\n')
-
-        for i in range(0,N):
-            f.write('    <node id="(%d)" />\n' % (i))
-
-        for i in range(0,N):
-            if i==Nm1:
-                f.write('    <edge source="(%d)" target="(%d)" />\n' % (i,0))
-            else:
-                f.write('    <edge source="(%d)" target="(%d)" />\n' % (i,i+1))
-
-        f.write('  </graph>\n')
-        f.write('</graphml>')
-
-
-def generate_2D_P(filename,N):
-    Nm1=N-1
-    with bz2.open(filename, 'wt') as f:
-        f.write("<?xml version='1.0' encoding='utf-8'?>\n")
-        f.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">\n')
-        f.write('  <graph edgedefault="undirected">\n')
-
-        for i in range(0,N):
-            for j in range(0,N):
-                f.write('    <node id="(%d, %d)" />\n' % (i,j))
-
-        for i in range(0,N):
-            for j in range(0,N):
-                if i==Nm1 and j==Nm1:
-                    f.write('    <edge source="(%d, %d)" target="(%d, %d)" />\n' % (i,j,i,0))
-                    f.write('    <edge source="(%d, %d)" target="(%d, %d)" />\n' % (i,j,0,j))
-                elif i==Nm1:
-                    f.write('    <edge source="(%d, %d)" target="(%d, %d)" />\n' % (i,j,i,j+1))
-                    f.write('    <edge source="(%d, %d)" target="(%d, %d)" />\n' % (i,j,0,j))
-                elif j==Nm1:
-                    f.write('    <edge source="(%d, %d)" target="(%d, %d)" />\n' % (i,j,i,0))
-                    f.write('    <edge source="(%d, %d)" target="(%d, %d)" />\n' % (i,j,i+1,j))
-                else:
-                    f.write('    <edge source="(%d, %d)" target="(%d, %d)" />\n' % (i,j,i,j+1))
-                    f.write('    <edge source="(%d, %d)" target="(%d, %d)" />\n' % (i,j,i+1,j))
-
-        f.write('  </graph>\n')
-        f.write('</graphml>')
-
-
-def generate_3D_P(filename,N):
-    Nm1=N-1
-    with bz2.open(filename, 'wt') as f:
-        f.write("<?xml version='1.0' encoding='utf-8'?>\n")
-        f.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">\n')
-        f.write('  <graph edgedefault="undirected">\n')
-
-        for i in range(0,N):
-            for j in range(0,N):
-                for k in range(0,N):
-                    f.write('    <node id="(%d, %d, %d)" />\n' % (i,j,k))
-
-        for i in range(0,N):
-            for j in range(0,N):
-                for k in range(0,N):
-                    if i==Nm1 and j==Nm1 and k==Nm1:
-                        f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (i,j,k,i,j,0))
-                        f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (i,j,k,i,0,k))
-                        f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (i,j,k,0,j,k))
-                    elif i==Nm1 and k==Nm1:
-                        f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (i,j,k,i,j,0))
-                        f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (i,j,k,i,j+1,k))
-                        f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (i,j,k,0,j,k))
-                    elif k==Nm1 and j==Nm1:
-                        f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (i,j,k,i,j,0))
-                        f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (i,j,k,i,0,k))
-                        f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (i,j,k,i+1,j,k))
-                    elif i==Nm1 and j==Nm1:
-                        f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (i,j,k,i,j,k+1))
-                        f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (i,j,k,i,0,k))
-                        f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (i,j,k,0,j,k))
-                    elif i==Nm1:
-                        f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (i,j,k,i,j,k+1))
-                        f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (i,j,k,i,j+1,k))
-                        f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (i,j,k,0,j,k))
-                    elif j==Nm1:
-                        f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (i,j,k,i,j,k+1))
-                        f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (i,j,k,i,0,k))
-                        f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (i,j,k,i+1,j,k))
-                    elif k==Nm1:
-                        f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (i,j,k,i,j,0))
-                        f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (i,j,k,i,j+1,k))
-                        f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (i,j,k,i+1,j,k))
-                    else:
-                        f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (i,j,k,i,j,k+1))
-                        f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (i,j,k,i,j+1,k))
-                        f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (i,j,k,i+1,j,k))
+        base="RL-"+("P" if periodic else "NP")+"_R-"+str(args.rp)+"_L"+str(args.l1)+"_d-"+str(args.d)
+    run_ensemble(generate, args, base, OUTPUT_EXT[args.format])
 
-        f.write('  </graph>\n')
-        f.write('</graphml>')
 
+def generate(args, filename, seed):
+    periodic = args.bc == 2
+    meta={'model': 'LP' if periodic else 'LNP', 'd': args.d, 'L': args.l1, 'bc': args.bc, 'rp': args.rp, 'seed': seed}
+    style=(args.ids,args.coords)
 
-def generate_4D_P(filename,N):
-    Nm1=N-1
-    with bz2.open(filename, 'wt') as f:
-        f.write("<?xml version='1.0' encoding='utf-8'?>\n")
-        f.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">\n')
-        f.write('  <graph edgedefault="undirected">\n')
+    ### ~~~~~~ GraphML blocks are formatted and compressed in parallel when only one replica is made
+    jobs=args.jobs if args.replicas == 1 else 1
 
-        for i in range(0,N):
-            for j in range(0,N):
-                for k in range(0,N):
-                    for m in range(0,N):
-                        f.write('    <node id="(%d, %d, %d, %d)" />\n' % (i,j,k,m))
+    ### ~~~~~~ Generate network if rewiring probability is zero
+    if args.rp == 0:
+        generate_lattice(filename,args.l1,args.d,periodic,args.format,meta,jobs,style)
 
-        for i in range(0,N):
-            for j in range(0,N):
-                for k in range(0,N):
-                    for m in range(0,N):
-                        if i==Nm1 and j==Nm1 and k==Nm1 and m==Nm1:
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,k,0))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,0,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,0,k,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,0,j,k,m))
-                        elif i==Nm1 and j==Nm1 and k==Nm1:
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,k,m+1))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,0,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,0,k,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,0,j,k,m))
-                        elif i==Nm1 and j==Nm1 and m==Nm1:
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,k,0))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,k+1,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,0,k,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,0,j,k,m))
-                        elif i==Nm1 and k==Nm1 and m==Nm1:
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,k,0))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,0,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j+1,k,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,0,j,k,m))
-                        elif j==Nm1 and k==Nm1 and m==Nm1:
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,k,0))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,0,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,0,k,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i+1,j,k,m))
-                        elif i==Nm1 and j==Nm1:
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,k,m+1))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,k+1,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,0,k,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,0,j,k,m))
-                        elif i==Nm1 and k==Nm1:
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,k,m+1))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,0,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j+1,k,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,0,j,k,m))
-                        elif i==Nm1 and m==Nm1:
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,k,0))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,k+1,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j+1,k,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,0,j,k,m))
-                        elif j==Nm1 and k==Nm1:
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,k,m+1))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,0,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,0,k,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i+1,j,k,m))
-                        elif j==Nm1 and m==Nm1:
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,k,0))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,k+1,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,0,k,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i+1,j,k,m))
-                        elif k==Nm1 and m==Nm1:
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,k,0))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,0,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j+1,k,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i+1,j,k,m))
-                        elif i==Nm1:
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,k,m+1))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,k+1,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j+1,k,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,0,j,k,m))
-                        elif j==Nm1:
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,k,m+1))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,k+1,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,0,k,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i+1,j,k,m))
-                        elif k==Nm1:
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,k,m+1))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,0,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j+1,k,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i+1,j,k,m))
-                        elif m==Nm1:
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,k,0))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,k+1,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j+1,k,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i+1,j,k,m))
-                        else:
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,k,m+1))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j,k+1,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i,j+1,k,m))
-                            f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (i,j,k,m,i+1,j,k,m))
-
-        f.write('  </graph>\n')
-        f.write('</graphml>')
-
-def generate_5D_P(filename,N):
-    Nm1=N-1
-    with bz2.open(filename, 'wt') as f:
-        f.write("<?xml version='1.0' encoding='utf-8'?>\n")
-        f.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">\n')
-        f.write('  <graph edgedefault="undirected">\n')
-
-        for i in range(0,N):
-            for j in range(0,N):
-                for k in range(0,N):
-                    for m in range(0,N):
-                        for z in range(0,N):
-                            f.write('    <node id="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z))
-
-        for i in range(0,N):
-            for j in range(0,N):
-                for k in range(0,N):
-                    for m in range(0,N):
-                        for z in range(0,N):
-                            if i==Nm1 and j==Nm1 and k==Nm1 and m==Nm1 and z==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,0))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,0,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,0,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,0,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,0,j,k,m,z))
-                            elif i==Nm1 and j==Nm1 and k==Nm1 and m==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,z+1))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,0,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,0,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,0,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,0,j,k,m,z))
-                            elif i==Nm1 and j==Nm1 and k==Nm1 and z==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,0))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m+1,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,0,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,0,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,0,j,k,m,z))
-                            elif i==Nm1 and j==Nm1 and m==Nm1 and z==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,0))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,0,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k+1,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,0,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,0,j,k,m,z))
-                            elif i==Nm1 and k==Nm1 and m==Nm1 and z==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,0))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,0,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,0,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j+1,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,0,j,k,m,z))
-                            elif j==Nm1 and k==Nm1 and m==Nm1 and z==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,0))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,0,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,0,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,0,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i+1,j,k,m,z))
-                            elif i==Nm1 and j==Nm1 and k==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,z+1))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m+1,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,0,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,0,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,0,j,k,m,z))
-                            elif i==Nm1 and j==Nm1 and z==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,0))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m+1,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k+1,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,0,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,0,j,k,m,z))
-                            elif i==Nm1 and j==Nm1 and m==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,z+1))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,0,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k+1,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,0,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,0,j,k,m,z))
-                            elif i==Nm1 and k==Nm1 and m==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,z+1))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,0,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,0,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j+1,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,0,j,k,m,z))
-                            elif i==Nm1 and k==Nm1 and z==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,0))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m+1,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,0,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j+1,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,0,j,k,m,z))
-                            elif i==Nm1 and m==Nm1 and z==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,0))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,0,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k+1,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j+1,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,0,j,k,m,z))
-                            elif k==Nm1 and m==Nm1 and z==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,0))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,0,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,0,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j+1,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i+1,j,k,m,z))
-                            elif j==Nm1 and m==Nm1 and z==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,0))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,0,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k+1,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,0,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i+1,j,k,m,z))
-                            elif j==Nm1 and k==Nm1 and z==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,0))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m+1,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,0,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,0,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i+1,j,k,m,z))
-                            elif j==Nm1 and k==Nm1 and m==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,z+1))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,0,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,0,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,0,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i+1,j,k,m,z))
-                            elif i==Nm1 and j==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,z+1))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m+1,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k+1,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,0,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,0,j,k,m,z))
-                            elif i==Nm1 and k==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,z+1))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m+1,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,0,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j+1,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,0,j,k,m,z))
-                            elif i==Nm1 and m==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,z+1))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,0,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k+1,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j+1,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,0,j,k,m,z))
-                            elif i==Nm1 and z==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,0))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m+1,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k+1,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j+1,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,0,j,k,m,z))
-                            elif j==Nm1 and k==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,z+1))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m+1,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,0,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,0,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i+1,j,k,m,z))
-                            elif j==Nm1 and m==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,z+1))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,0,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k+1,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,0,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i+1,j,k,m,z))
-                            elif j==Nm1 and z==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,0))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m+1,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k+1,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,0,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i+1,j,k,m,z))
-                            elif k==Nm1 and m==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,z+1))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,0,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,0,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j+1,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i+1,j,k,m,z))
-                            elif k==Nm1 and z==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,0))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m+1,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,0,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j+1,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i+1,j,k,m,z))
-                            elif m==Nm1 and z==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,0))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,0,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k+1,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j+1,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i+1,j,k,m,z))
-                            elif i==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,z+1))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m+1,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k+1,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j+1,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,0,j,k,m,z))
-                            elif j==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,z+1))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m+1,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k+1,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,0,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i+1,j,k,m,z))
-                            elif k==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,z+1))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m+1,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,0,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j+1,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i+1,j,k,m,z))
-                            elif m==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,z+1))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,0,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k+1,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j+1,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i+1,j,k,m,z))
-                            elif z==Nm1:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,0))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m+1,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k+1,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j+1,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i+1,j,k,m,z))
-                            else:
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m,z+1))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k,m+1,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j,k+1,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i,j+1,k,m,z))
-                                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z,i+1,j,k,m,z))
-        f.write('  </graph>\n')
-        f.write('</graphml>')
-
-
-def generate_1D_NP_RP(filename,N,pR):
-    Nm1=N-1
-    with bz2.open(filename, 'wt') as f:
-        f.write("<?xml version='1.0' encoding='utf-8'?>\n")
-        f.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">\n')
-        f.write('  <graph edgedefault="undirected">\n')
-
-        nodes=[]
-        edges=[]
-
-        for i in range(0,N):
-            nodes.append([i])
-            f.write('    <node id="(%d)" />\n' % (i))
-
-        for i in range(0,N):
-            if i==Nm1:
+    ### ~~~~~~ Generate network if rewiring probability is nonzero
+    else:
+        generate_RP(filename,args.l1,args.d,periodic,args.rp,args.format,meta,seed,jobs,style)
+
+
+### ~~~~~~ Node coordinate label pieces "(i, j, ...)" for an array of lattice node ids
+def lattice_labels(ids,N,d):
+    coords=np.unravel_index(ids,(N,)*d)
+    digits=int_digits(np.arange(N))
+    labels=[b'(']
+    for axis,c in enumerate(coords):
+        if axis:
+            labels.append(b', ')
+        labels.append(digits[c])
+    labels.append(b')')
+    return labels
+
+
+### ~~~~~~ Lattice edges leaving nodes start..stop-1, last dimension first for every node, with
+### ~~~~~~ their slots src*d + k that number edges independently of the boundary conditions
+def lattice_edges(N,d,periodic,start,stop):
+    ids=np.arange(start,stop,dtype=np.int64)
+    coords=np.unravel_index(ids,(N,)*d)
+    tar=np.empty((len(ids),d),dtype=np.int64)
+    valid=np.ones((len(ids),d),dtype=bool)
+    for col,axis in enumerate(reversed(range(d))):
+        stride=N**(d-1-axis)
+        at_end=coords[axis]==N-1
+        tar[:,col]=ids+stride
+        tar[at_end,col]-=N*stride
+        if not periodic:
+            valid[:,col]=~at_end
+    src=np.repeat(ids,d)
+    slot=np.arange(start*d,stop*d,dtype=np.int64)
+    valid=valid.ravel()
+    return src[valid],tar.ravel()[valid],slot[valid]
+
+
+### ~~~~~~ Node label pieces, coordinate strings or the integer ids themselves
+def node_labels(ids,N,d,style):
+    if style[0] == 'int':
+        return [int_digits(ids)]
+    return lattice_labels(ids,N,d)
+
+
+### ~~~~~~ GraphML node lines of lattice nodes start..stop-1, with their coordinates as node
+### ~~~~~~ attributes d0.. when requested
+def lattice_node_block(N,d,start,stop,style):
+    ids=np.arange(start,stop)
+    data=[]
+    if style == ('int','data'):
+        digits=int_digits(np.arange(N))
+        data=[(b'd%d' % axis,[digits[c]]) for axis,c in enumerate(np.unravel_index(ids,(N,)*d))]
+    return format_nodes(node_labels(ids,N,d,style),len(ids),data)
+
+
+### ~~~~~~ GraphML edge lines of lattice edge id arrays
+def lattice_edge_block(src,tar,N,d,style):
+    return format_edges(node_labels(src,N,d,style),node_labels(tar,N,d,style),len(src))
+
+
+### ~~~~~~ GraphML edge lines of the unrewired edges leaving nodes start..stop-1
+def pristine_edge_block(N,d,periodic,start,stop,style):
+    src,tar,slot=lattice_edges(N,d,periodic,start,stop)
+    return lattice_edge_block(src,tar,N,d,style)
+
+
+### ~~~~~~ Coordinates of all nodes as an L^d x d array next to the network file
+def write_coordinates(filename,N,d):
+    num_nodes=N**d
+    coords=np.lib.format.open_memmap(coordinates_name(filename),mode='w+',dtype=np.min_scalar_type(N-1),shape=(num_nodes,d))
+    for start in range(0,num_nodes,CHUNK_NODES):
+        stop=min(start+CHUNK_NODES,num_nodes)
+        coords[start:stop]=np.array(np.unravel_index(np.arange(start,stop),(N,)*d)).T
+    coords.flush()
+
+
+### ~~~~~~ Write lattice node ids and edge id arrays in the requested format. The GraphML node and
+### ~~~~~~ edge blocks are formatted and compressed as concatenated bz2 streams, by a pool of jobs
+### ~~~~~~ processes if jobs > 1, so the file is the same whatever the number of jobs. edge_tasks are the (function, *args) building the
+### ~~~~~~ edge blocks, which lets unrewired lattices generate their edges in the workers.
+### ~~~~~~ style is the (ids, coords) pair of the -ids and -coords options.
+def write_lattice(filename,N,d,edge_chunks,fmt,meta,jobs=1,edge_tasks=None,style=('coord','none')):
+    num_nodes=N**d
+    if style[1] == 'sidecar':
+        write_coordinates(filename,N,d)
+    if fmt == 'binary':
+        write_binary(filename,dict(meta,num_nodes=num_nodes,shape=[N]*d),edge_chunks)
+        return
+
+    node_tasks=[(lattice_node_block,N,d,start,min(start+CHUNK_NODES,num_nodes),style) for start in range(0,num_nodes,CHUNK_NODES)]
+    if edge_tasks is None:
+        edge_tasks=((lattice_edge_block,src,tar,N,d,style) for src,tar in edge_chunks)
+    keys=b''
+    if style == ('int','data'):
+        keys=b''.join(graphml_key(b'd%d' % axis,'coord'+str(axis),'long') for axis in range(d))
+
+    write_graphml_parallel(filename,itertools.chain(node_tasks,edge_tasks),jobs,keys)
+
+
+def generate_lattice(filename,N,d,periodic,fmt,meta,jobs=1,style=('coord','none')):
+    num_nodes=N**d
+    bounds=[(start,min(start+CHUNK_NODES,num_nodes)) for start in range(0,num_nodes,CHUNK_NODES)]
+    edge_chunks=(lattice_edges(N,d,periodic,start,stop)[:2] for start,stop in bounds)
+    edge_tasks=[(pristine_edge_block,N,d,periodic,start,stop,style) for start,stop in bounds]
+    write_lattice(filename,N,d,edge_chunks,fmt,meta,jobs,edge_tasks,style)
+
+
+### ~~~~~~ Whether the pairs (s, t) are edges of the unrewired lattice
+def lattice_adjacent(s,t,N,d,periodic):
+    diff=np.abs(np.array(np.unravel_index(s,(N,)*d))-np.array(np.unravel_index(t,(N,)*d)))
+    if periodic:
+        diff=np.minimum(diff,N-diff)
+    return (diff.sum(axis=0) == 1) & (diff.max(axis=0) == 1)
+
+
+### ~~~~~~ Degree of lattice nodes in the unrewired lattice
+def lattice_degree(ids,N,d,periodic):
+    coords=np.array(np.unravel_index(ids,(N,)*d))
+    if periodic:
+        return np.full(len(ids),d*min(N-1,2))
+    return (coords > 0).sum(axis=0)+(coords < N-1).sum(axis=0)
+
+
+### ~~~~~~ Stream the lattice edges chunk by chunk, rewiring the target of every edge with
+### ~~~~~~ probability pR to a uniformly chosen node that is not the source and not already
+### ~~~~~~ connected to it. An edge exists if it is a lattice edge that has not been rewired
+### ~~~~~~ away or if it was added by rewiring, so only the rewired edges are kept in memory.
+### ~~~~~~ As in networkx's Watts–Strogatz generator, edges of saturated sources are kept.
+### ~~~~~~ Draws for an edge are keyed by its slot and the attempt number, so the chunk size does
+### ~~~~~~ not change the network.
+def rewired_edge_chunks(N,d,periodic,pR,seed):
+    num_nodes=N**d
+    removed=set()
+    added=set()
+    delta={}
+    for start in range(0,num_nodes,CHUNK_NODES):
+        src,tar,slot=lattice_edges(N,d,periodic,start,min(start+CHUNK_NODES,num_nodes))
+        rewire=np.flatnonzero(uniform(seed,STREAM_REWIRE,slot) < pR)
+        cand=integers(seed,STREAM_TARGET,slot[rewire],num_nodes)
+        adjacent=lattice_adjacent(src[rewire],cand,N,d,periodic)
+        degree=lattice_degree(src[rewire],N,d,periodic)
+        for e,t,lat,k in zip(rewire.tolist(),cand.tolist(),adjacent.tolist(),degree.tolist()):
+            s=int(src[e])
+            if k+delta.get(s,0) >= num_nodes-1:
                 continue
-            else:
-                edges.append([i,i+1])
-
-        cpy_edges = edges[:]
-        edgesAdded = copy.deepcopy(edges)
-        for ed in cpy_edges:
-            src=ed[0:1]
-            tar=ed[1:2]
-            if random.random() < pR:
-                tar = random.choice(nodes)
-                o1=[src[0],tar[0]]
-                o2=[tar[0],src[0]]
-                while tar == src or o1 in edgesAdded or o2 in edgesAdded:
-                    o1=[src[0],tar[0]]
-                    o2=[tar[0],src[0]]
-                    tar = random.choice(nodes)
-                edgesAdded.append([src[0],tar[0]])
-                edgesAdded.remove(ed)
-                f.write('    <edge source="(%d)" target="(%d)" />\n' % (src[0],tar[0]))
-            else:
-                f.write('    <edge source="(%d)" target="(%d)" />\n' % (src[0],tar[0]))
-
-        f.write('  </graph>\n')
-        f.write('</graphml>')
-
-
-def generate_2D_NP_RP(filename,N,pR):
-    Nm1=N-1
-    with bz2.open(filename, 'wt') as f:
-        f.write("<?xml version='1.0' encoding='utf-8'?>\n")
-        f.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">\n')
-        f.write('  <graph edgedefault="undirected">\n')
-
-        nodes=[]
-        edges=[]
-
-        for i in range(0,N):
-            for j in range(0,N):
-                nodes.append([i,j])
-                f.write('    <node id="(%d, %d)" />\n' % (i,j))
-
-        for i in range(0,N):
-            for j in range(0,N):
-                if i==Nm1 and j==Nm1:
-                    continue
-                elif i==Nm1:
-                    edges.append([i,j,i,j+1])
-                elif j==Nm1:
-                    edges.append([i,j,i+1,j])
-
-                else:
-                    edges.append([i,j,i,j+1])
-                    edges.append([i,j,i+1,j])
-
-        cpy_edges = edges[:]
-        edgesAdded = copy.deepcopy(edges)
-        for ed in cpy_edges:
-            src=ed[0:2]
-            tar=ed[2:4]
-            if random.random() < pR:
-                tar = random.choice(nodes)
-                o1=[src[0],src[1],tar[0],tar[1]]
-                o2=[tar[0],tar[1],src[0],src[1]]
-                while tar == src or o1 in edgesAdded or o2 in edgesAdded:
-                    o1=[src[0],src[1],tar[0],tar[1]]
-                    o2=[tar[0],tar[1],src[0],src[1]]
-                    tar = random.choice(nodes)
-                edgesAdded.append([src[0],src[1],tar[0],tar[1]])
-                edgesAdded.remove(ed)
-                f.write('    <edge source="(%d, %d)" target="(%d, %d)" />\n' % (src[0],src[1],tar[0],tar[1]))
-            else:
-                f.write('    <edge source="(%d, %d)" target="(%d, %d)" />\n' % (src[0],src[1],tar[0],tar[1]))
-
-        f.write('  </graph>\n')
-        f.write('</graphml>')
-
-
-def generate_3D_NP_RP(filename,N,pR):
-    Nm1=N-1
-    with bz2.open(filename, 'wt') as f:
-        f.write("<?xml version='1.0' encoding='utf-8'?>\n")
-        f.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">\n')
-        f.write('  <graph edgedefault="undirected">\n')
-
-        nodes=[]
-        edges=[]
-
-        for i in range(0,N):
-            for j in range(0,N):
-                for k in range(0,N):
-                    nodes.append([i,j,k])
-                    f.write('    <node id="(%d, %d, %d)" />\n' % (i,j,k))
-
-        for i in range(0,N):
-            for j in range(0,N):
-               for k in range(0,N):
-                    if i==Nm1 and j==Nm1 and k==Nm1:
-                        continue
-                    elif i==Nm1 and k==Nm1:
-                        edges.append([i,j,k,i,j+1,k])
-                    elif k==Nm1 and j==Nm1:
-                        edges.append([i,j,k,i+1,j,k])
-                    elif i==Nm1 and j==Nm1:
-                        edges.append([i,j,k,i,j,k+1])
-                    elif i==Nm1:
-                        edges.append([i,j,k,i,j,k+1])
-                        edges.append([i,j,k,i,j+1,k])
-                    elif j==Nm1:
-                        edges.append([i,j,k,i,j,k+1])
-                        edges.append([i,j,k,i+1,j,k])
-                    elif k==Nm1:
-                        edges.append([i,j,k,i,j+1,k])
-                        edges.append([i,j,k,i+1,j,k])
-                    else:
-                        edges.append([i,j,k,i,j,k+1])
-                        edges.append([i,j,k,i,j+1,k])
-                        edges.append([i,j,k,i+1,j,k])
-
-        cpy_edges = edges[:]
-        edgesAdded = copy.deepcopy(edges)
-        for ed in cpy_edges:
-            src=ed[0:3]
-            tar=ed[3:6]
-            if random.random() < pR:
-                tar = random.choice(nodes)
-                o1=[src[0],src[1],src[2],tar[0],tar[1],tar[2]]
-                o2=[tar[0],tar[1],tar[2],src[0],src[1],src[2]]
-                while tar == src or o1 in edgesAdded or o2 in edgesAdded:
-                    o1=[src[0],src[1],src[2],tar[0],tar[1],tar[2]]
-                    o2=[tar[0],tar[1],tar[2],src[0],src[1],src[2]]
-                    tar = random.choice(nodes)
-                edgesAdded.append([src[0],src[1],src[2],tar[0],tar[1],tar[2]])
-                edgesAdded.remove(ed)
-                f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (src[0],src[1],src[2],tar[0],tar[1],tar[2]))
-            else:
-                f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (src[0],src[1],src[2],tar[0],tar[1],tar[2]))
-
-        f.write('  </graph>\n')
-        f.write('</graphml>')
-
-def generate_4D_NP_RP(filename,N,pR):
-    Nm1=N-1
-    with bz2.open(filename, 'wt') as f:
-        f.write("<?xml version='1.0' encoding='utf-8'?>\n")
-        f.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">\n')
-        f.write('  <graph edgedefault="undirected">\n')
-
-        nodes=[]
-        edges=[]
-
-        for i in range(0,N):
-            for j in range(0,N):
-                for k in range(0,N):
-                    for m in range(0,N):
-                        nodes.append([i,j,k,m])
-                        f.write('    <node id="(%d, %d, %d, %d)" />\n' % (i,j,k,m))
-
-        for i in range(0,N):
-            for j in range(0,N):
-                for k in range(0,N):
-                    for m in range(0,N):
-                        if i==Nm1 and j==Nm1 and k==Nm1 and m==Nm1:
-                            continue
-                        elif i==Nm1 and j==Nm1 and k==Nm1:
-                            edges.append([i,j,k,m,i,j,k,m+1])
-                        elif i==Nm1 and j==Nm1 and m==Nm1:
-                            edges.append([i,j,k,m,i,j,k+1,m])
-                        elif i==Nm1 and k==Nm1 and m==Nm1:
-                            edges.append([i,j,k,m,i,j+1,k,m])
-                        elif j==Nm1 and k==Nm1 and m==Nm1:
-                            edges.append([i,j,k,m,i+1,j,k,m])
-                        elif i==Nm1 and j==Nm1:
-                            edges.append([i,j,k,m,i,j,k,m+1])
-                            edges.append([i,j,k,m,i,j,k+1,m])
-                        elif i==Nm1 and k==Nm1:
-                            edges.append([i,j,k,m,i,j,k,m+1])
-                            edges.append([i,j,k,m,i,j+1,k,m])
-                        elif i==Nm1 and m==Nm1:
-                            edges.append([i,j,k,m,i,j,k+1,m])
-                            edges.append([i,j,k,m,i,j+1,k,m])
-                        elif j==Nm1 and k==Nm1:
-                            edges.append([i,j,k,m,i,j,k,m+1])
-                            edges.append([i,j,k,m,i+1,j,k,m])
-                        elif j==Nm1 and m==Nm1:
-                            edges.append([i,j,k,m,i,j,k+1,m])
-                            edges.append([i,j,k,m,i+1,j,k,m])
-                        elif k==Nm1 and m==Nm1:
-                            edges.append([i,j,k,m,i,j+1,k,m])
-                            edges.append([i,j,k,m,i+1,j,k,m])
-                        elif i==Nm1:
-                            edges.append([i,j,k,m,i,j,k,m+1])
-                            edges.append([i,j,k,m,i,j,k+1,m])
-                            edges.append([i,j,k,m,i,j+1,k,m])
-                        elif j==Nm1:
-                            edges.append([i,j,k,m,i,j,k,m+1])
-                            edges.append([i,j,k,m,i,j,k+1,m])
-                            edges.append([i,j,k,m,i+1,j,k,m])
-                        elif k==Nm1:
-                            edges.append([i,j,k,m,i,j,k,m+1])
-                            edges.append([i,j,k,m,i,j+1,k,m])
-                            edges.append([i,j,k,m,i+1,j,k,m])
-                        elif m==Nm1:
-                            edges.append([i,j,k,m,i,j,k+1,m])
-                            edges.append([i,j,k,m,i,j+1,k,m])
-                            edges.append([i,j,k,m,i+1,j,k,m])
-                        else:
-                            edges.append([i,j,k,m,i,j,k,m+1])
-                            edges.append([i,j,k,m,i,j,k+1,m])
-                            edges.append([i,j,k,m,i,j+1,k,m])
-                            edges.append([i,j,k,m,i+1,j,k,m])
-
-        cpy_edges = edges[:]
-        edgesAdded = copy.deepcopy(edges)
-        for ed in cpy_edges:
-            src=ed[0:4]
-            tar=ed[4:8]
-            if random.random() < pR:
-                tar = random.choice(nodes)
-                o1=[src[0],src[1],src[2],src[3],tar[0],tar[1],tar[2],tar[3]]
-                o2=[tar[0],tar[1],tar[2],tar[3],src[0],src[1],src[2],src[3]]
-                while tar == src or o1 in edgesAdded or o2 in edgesAdded:
-                    o1=[src[0],src[1],src[2],src[3],tar[0],tar[1],tar[2],tar[3]]
-                    o2=[tar[0],tar[1],tar[2],tar[3],src[0],src[1],src[2],src[3]]
-                    tar = random.choice(nodes)
-                edgesAdded.append([src[0],src[1],src[2],src[3],tar[0],tar[1],tar[2],tar[3]])
-                edgesAdded.remove(ed)
-                f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (src[0],src[1],src[2],src[3],tar[0],tar[1],tar[2],tar[3]))
-            else:
-                f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (src[0],src[1],src[2],src[3],tar[0],tar[1],tar[2],tar[3]))
-
-        f.write('  </graph>\n')
-        f.write('</graphml>')
-
-def generate_5D_NP_RP(filename,N):
-    Nm1=N-1
-    with bz2.open(filename, 'wt') as f:
-        f.write("<?xml version='1.0' encoding='utf-8'?>\n")
-        f.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">\n')
-        f.write('  <graph edgedefault="undirected">\n')
-
-        nodes=[]
-        edges=[]
-
-        for i in range(0,N):
-            for j in range(0,N):
-                for k in range(0,N):
-                    for m in range(0,N):
-                        for z in range(0,N):
-                            nodes.append([i,j,k,m,z])
-                            f.write('    <node id="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z))
-
-        for i in range(0,N):
-            for j in range(0,N):
-                for k in range(0,N):
-                    for m in range(0,N):
-                        for z in range(0,N):
-                            if i==Nm1 and j==Nm1 and k==Nm1 and m==Nm1 and z==Nm1:
-                                continue
-                            elif i==Nm1 and j==Nm1 and k==Nm1 and m==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                            elif i==Nm1 and j==Nm1 and k==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                            elif i==Nm1 and j==Nm1 and m==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                            elif i==Nm1 and k==Nm1 and m==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                            elif j==Nm1 and k==Nm1 and m==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif i==Nm1 and j==Nm1 and k==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                            elif i==Nm1 and j==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                            elif i==Nm1 and j==Nm1 and m==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                            elif i==Nm1 and k==Nm1 and m==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                            elif i==Nm1 and k==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                            elif i==Nm1 and m==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                            elif k==Nm1 and m==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif j==Nm1 and m==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif j==Nm1 and k==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif j==Nm1 and k==Nm1 and m==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif i==Nm1 and j==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                            elif i==Nm1 and k==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                            elif i==Nm1 and m==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                            elif i==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                            elif j==Nm1 and k==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif j==Nm1 and m==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif j==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif k==Nm1 and m==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif k==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif m==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif i==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                            elif j==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif k==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif m==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            else:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-
-        cpy_edges = edges[:]
-        edgesAdded = copy.deepcopy(edges)
-        for ed in cpy_edges:
-            src=ed[0:5]
-            tar=ed[5:10]
-            if random.random() < pR:
-                tar = random.choice(nodes)
-                o1=[src[0],src[1],src[2],src[3],src[4],tar[0],tar[1],tar[2],tar[3],tar[4]]
-                o2=[tar[0],tar[1],tar[2],tar[3],tar[4],src[0],src[1],src[2],src[3],src[4]]
-                while tar == src or o1 in edgesAdded or o2 in edgesAdded:
-                    o1=[src[0],src[1],src[2],src[3],src[4],tar[0],tar[1],tar[2],tar[3],tar[4]]
-                    o2=[tar[0],tar[1],tar[2],tar[3],tar[4],src[0],src[1],src[2],src[3],src[4]]
-                    tar = random.choice(nodes)
-                edgesAdded.append([src[0],src[1],src[2],src[3],src[4],tar[0],tar[1],tar[2],tar[3],tar[4]])
-                edgesAdded.remove(ed)
-                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (src[0],src[1],src[2],src[3],src[4],tar[0],tar[1],tar[2],tar[3],tar[4]))
-            else:
-                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (src[0],src[1],src[2],src[3],src[4],tar[0],tar[1],tar[2],tar[3],tar[4]))
-
-        f.write('  </graph>\n')
-        f.write('</graphml>')
-
-def generate_1D_P_RP(filename,N,pR):
-    Nm1=N-1
-    with bz2.open(filename, 'wt') as f:
-        f.write("<?xml version='1.0' encoding='utf-8'?>\n")
-        f.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">\n')
-        f.write('  <graph edgedefault="undirected">\n')
-
-        nodes=[]
-        edges=[]
-
-        for i in range(0,N):
-            nodes.append([i])
-            f.write('    <node id="(%d)" />\n' % (i))
-
-        for i in range(0,N):
-            if i==Nm1:
-                edges.append([i,0])
-            else:
-                edges.append([i,i+1])
-
-        cpy_edges = edges[:]
-        edgesAdded = copy.deepcopy(edges)
-        for ed in cpy_edges:
-            src=ed[0:1]
-            tar=ed[1:2]
-            if random.random() < pR:
-                tar = random.choice(nodes)
-                o1=[src[0],tar[0]]
-                o2=[tar[0],src[0]]
-                while tar == src or o1 in edgesAdded or o2 in edgesAdded:
-                    o1=[src[0],tar[0]]
-                    o2=[tar[0],src[0]]
-                    tar = random.choice(nodes)
-                edgesAdded.append([src[0],tar[0]])
-                edgesAdded.remove(ed)
-                f.write('    <edge source="(%d)" target="(%d)" />\n' % (src[0],tar[0]))
-            else:
-                f.write('    <edge source="(%d)" target="(%d)" />\n' % (src[0],tar[0]))
-
-        f.write('  </graph>\n')
-        f.write('</graphml>')
-
-def generate_2D_P_RP(filename,N,pR):
-    Nm1=N-1
-    with bz2.open(filename, 'wt') as f:
-        f.write("<?xml version='1.0' encoding='utf-8'?>\n")
-        f.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">\n')
-        f.write('  <graph edgedefault="undirected">\n')
-
-        nodes=[]
-        edges=[]
-
-        for i in range(0,N):
-            for j in range(0,N):
-                nodes.append([i,j])
-                f.write('    <node id="(%d, %d)" />\n' % (i,j))
-
-        for i in range(0,N):
-            for j in range(0,N):
-                if i==Nm1 and j==Nm1:
-                    edges.append([i,j,i,0])
-                    edges.append([i,j,0,j])
-                elif i==Nm1:
-                    edges.append([i,j,i,j+1])
-                    edges.append([i,j,0,j])
-                elif j==Nm1:
-                    edges.append([i,j,i,0])
-                    edges.append([i,j,i+1,j])
-
-                else:
-                    edges.append([i,j,i,j+1])
-                    edges.append([i,j,i+1,j])
-
-        cpy_edges = edges[:]
-        edgesAdded = copy.deepcopy(edges)
-        for ed in cpy_edges:
-            src=ed[0:2]
-            tar=ed[2:4]
-            if random.random() < pR:
-                tar = random.choice(nodes)
-                o1=[src[0],src[1],tar[0],tar[1]]
-                o2=[tar[0],tar[1],src[0],src[1]]
-                while tar == src or o1 in edgesAdded or o2 in edgesAdded:
-                    o1=[src[0],src[1],tar[0],tar[1]]
-                    o2=[tar[0],tar[1],src[0],src[1]]
-                    tar = random.choice(nodes)
-                edgesAdded.append([src[0],src[1],tar[0],tar[1]])
-                edgesAdded.remove(ed)
-                f.write('    <edge source="(%d, %d)" target="(%d, %d)" />\n' % (src[0],src[1],tar[0],tar[1]))
-            else:
-                f.write('    <edge source="(%d, %d)" target="(%d, %d)" />\n' % (src[0],src[1],tar[0],tar[1]))
-
-        f.write('  </graph>\n')
-        f.write('</graphml>')
-
-
-def generate_3D_P_RP(filename,N,pR):
-    Nm1=N-1
-    with bz2.open(filename, 'wt') as f:
-        f.write("<?xml version='1.0' encoding='utf-8'?>\n")
-        f.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">\n')
-        f.write('  <graph edgedefault="undirected">\n')
-
-        nodes=[]
-        edges=[]
-
-        for i in range(0,N):
-            for j in range(0,N):
-                for k in range(0,N):
-                    nodes.append([i,j,k])
-                    f.write('    <node id="(%d, %d, %d)" />\n' % (i,j,k))
-
-        for i in range(0,N):
-            for j in range(0,N):
-               for k in range(0,N):
-                    if i==Nm1 and j==Nm1 and k==Nm1:
-                        edges.append([i,j,k,i,j,0])
-                        edges.append([i,j,k,i,0,k])
-                        edges.append([i,j,k,0,j,k])
-                    elif i==Nm1 and k==Nm1:
-                        edges.append([i,j,k,i,j,0])
-                        edges.append([i,j,k,i,j+1,k])
-                        edges.append([i,j,k,0,j,k])
-                    elif k==Nm1 and j==Nm1:
-                        edges.append([i,j,k,i,j,0])
-                        edges.append([i,j,k,i,0,k])
-                        edges.append([i,j,k,i+1,j,k])
-                    elif i==Nm1 and j==Nm1:
-                        edges.append([i,j,k,i,j,k+1])
-                        edges.append([i,j,k,i,0,k])
-                        edges.append([i,j,k,0,j,k])
-                    elif i==Nm1:
-                        edges.append([i,j,k,i,j,k+1])
-                        edges.append([i,j,k,i,j+1,k])
-                        edges.append([i,j,k,0,j,k])
-                    elif j==Nm1:
-                        edges.append([i,j,k,i,j,k+1])
-                        edges.append([i,j,k,i,0,k])
-                        edges.append([i,j,k,i+1,j,k])
-                    elif k==Nm1:
-                        edges.append([i,j,k,i,j,0])
-                        edges.append([i,j,k,i,j+1,k])
-                        edges.append([i,j,k,i+1,j,k])
-                    else:
-                        edges.append([i,j,k,i,j,k+1])
-                        edges.append([i,j,k,i,j+1,k])
-                        edges.append([i,j,k,i+1,j,k])
-
-        cpy_edges = edges[:]
-        edgesAdded = copy.deepcopy(edges)
-        for ed in cpy_edges:
-            src=ed[0:3]
-            tar=ed[3:6]
-            if random.random() < pR:
-                tar = random.choice(nodes)
-                o1=[src[0],src[1],src[2],tar[0],tar[1],tar[2]]
-                o2=[tar[0],tar[1],tar[2],src[0],src[1],src[2]]
-                while tar == src or o1 in edgesAdded or o2 in edgesAdded:
-                    o1=[src[0],src[1],src[2],tar[0],tar[1],tar[2]]
-                    o2=[tar[0],tar[1],tar[2],src[0],src[1],src[2]]
-                    tar = random.choice(nodes)
-                edgesAdded.append([src[0],src[1],src[2],tar[0],tar[1],tar[2]])
-                edgesAdded.remove(ed)
-                f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (src[0],src[1],src[2],tar[0],tar[1],tar[2]))
-            else:
-                f.write('    <edge source="(%d, %d, %d)" target="(%d, %d, %d)" />\n' % (src[0],src[1],src[2],tar[0],tar[1],tar[2]))
-
-        f.write('  </graph>\n')
-        f.write('</graphml>')
-
-def generate_4D_P_RP(filename,N,pR):
-    Nm1=N-1
-    with bz2.open(filename, 'wt') as f:
-        f.write("<?xml version='1.0' encoding='utf-8'?>\n")
-        f.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">\n')
-        f.write('  <graph edgedefault="undirected">\n')
-
-        nodes=[]
-        edges=[]
-
-        for i in range(0,N):
-            for j in range(0,N):
-                for k in range(0,N):
-                    for m in range(0,N):
-                        nodes.append([i,j,k,m])
-                        f.write('    <node id="(%d, %d, %d, %d)" />\n' % (i,j,k,m))
-
-        for i in range(0,N):
-            for j in range(0,N):
-                for k in range(0,N):
-                    for m in range(0,N):
-                        if i==Nm1 and j==Nm1 and k==Nm1 and m==Nm1:
-                            edges.append([i,j,k,m,i,j,k,0])
-                            edges.append([i,j,k,m,i,j,0,m])
-                            edges.append([i,j,k,m,i,0,k,m])
-                            edges.append([i,j,k,m,0,j,k,m])
-                        elif i==Nm1 and j==Nm1 and k==Nm1:
-                            edges.append([i,j,k,m,i,j,k,m+1])
-                            edges.append([i,j,k,m,i,j,0,m])
-                            edges.append([i,j,k,m,i,0,k,m])
-                            edges.append([i,j,k,m,0,j,k,m])
-                        elif i==Nm1 and j==Nm1 and m==Nm1:
-                            edges.append([i,j,k,m,i,j,k,0])
-                            edges.append([i,j,k,m,i,j,k+1,m])
-                            edges.append([i,j,k,m,i,0,k,m])
-                            edges.append([i,j,k,m,0,j,k,m])
-                        elif i==Nm1 and k==Nm1 and m==Nm1:
-                            edges.append([i,j,k,m,i,j,k,0])
-                            edges.append([i,j,k,m,i,j,0,m])
-                            edges.append([i,j,k,m,i,j+1,k,m])
-                            edges.append([i,j,k,m,0,j,k,m])
-                        elif j==Nm1 and k==Nm1 and m==Nm1:
-                            edges.append([i,j,k,m,i,j,k,0])
-                            edges.append([i,j,k,m,i,j,0,m])
-                            edges.append([i,j,k,m,i,0,k,m])
-                            edges.append([i,j,k,m,i+1,j,k,m])
-                        elif i==Nm1 and j==Nm1:
-                            edges.append([i,j,k,m,i,j,k,m+1])
-                            edges.append([i,j,k,m,i,j,k+1,m])
-                            edges.append([i,j,k,m,i,0,k,m])
-                            edges.append([i,j,k,m,0,j,k,m])
-                        elif i==Nm1 and k==Nm1:
-                            edges.append([i,j,k,m,i,j,k,m+1])
-                            edges.append([i,j,k,m,i,j,0,m])
-                            edges.append([i,j,k,m,i,j+1,k,m])
-                            edges.append([i,j,k,m,0,j,k,m])
-                        elif i==Nm1 and m==Nm1:
-                            edges.append([i,j,k,m,i,j,k,0])
-                            edges.append([i,j,k,m,i,j,k+1,m])
-                            edges.append([i,j,k,m,i,j+1,k,m])
-                            edges.append([i,j,k,m,0,j,k,m])
-                        elif j==Nm1 and k==Nm1:
-                            edges.append([i,j,k,m,i,j,k,m+1])
-                            edges.append([i,j,k,m,i,j,0,m])
-                            edges.append([i,j,k,m,i,0,k,m])
-                            edges.append([i,j,k,m,i+1,j,k,m])
-                        elif j==Nm1 and m==Nm1:
-                            edges.append([i,j,k,m,i,j,k,0])
-                            edges.append([i,j,k,m,i,j,k+1,m])
-                            edges.append([i,j,k,m,i,0,k,m])
-                            edges.append([i,j,k,m,i+1,j,k,m])
-                        elif k==Nm1 and m==Nm1:
-                            edges.append([i,j,k,m,i,j,k,0])
-                            edges.append([i,j,k,m,i,j,0,m])
-                            edges.append([i,j,k,m,i,j+1,k,m])
-                            edges.append([i,j,k,m,i+1,j,k,m])
-                        elif i==Nm1:
-                            edges.append([i,j,k,m,i,j,k,m+1])
-                            edges.append([i,j,k,m,i,j,k+1,m])
-                            edges.append([i,j,k,m,i,j+1,k,m])
-                            edges.append([i,j,k,m,0,j,k,m])
-                        elif j==Nm1:
-                            edges.append([i,j,k,m,i,j,k,m+1])
-                            edges.append([i,j,k,m,i,j,k+1,m])
-                            edges.append([i,j,k,m,i,0,k,m])
-                            edges.append([i,j,k,m,i+1,j,k,m])
-                        elif k==Nm1:
-                            edges.append([i,j,k,m,i,j,k,m+1])
-                            edges.append([i,j,k,m,i,j,0,m])
-                            edges.append([i,j,k,m,i,j+1,k,m])
-                            edges.append([i,j,k,m,i+1,j,k,m])
-                        elif m==Nm1:
-                            edges.append([i,j,k,m,i,j,k,0])
-                            edges.append([i,j,k,m,i,j,k+1,m])
-                            edges.append([i,j,k,m,i,j+1,k,m])
-                            edges.append([i,j,k,m,i+1,j,k,m])
-                        else:
-                            edges.append([i,j,k,m,i,j,k,m+1])
-                            edges.append([i,j,k,m,i,j,k+1,m])
-                            edges.append([i,j,k,m,i,j+1,k,m])
-                            edges.append([i,j,k,m,i+1,j,k,m])
-
-        cpy_edges = edges[:]
-        edgesAdded = copy.deepcopy(edges)
-        for ed in cpy_edges:
-            src=ed[0:4]
-            tar=ed[4:8]
-            if random.random() < pR:
-                tar = random.choice(nodes)
-                o1=[src[0],src[1],src[2],src[3],tar[0],tar[1],tar[2],tar[3]]
-                o2=[tar[0],tar[1],tar[2],tar[3],src[0],src[1],src[2],src[3]]
-                while tar == src or o1 in edgesAdded or o2 in edgesAdded:
-                    o1=[src[0],src[1],src[2],src[3],tar[0],tar[1],tar[2],tar[3]]
-                    o2=[tar[0],tar[1],tar[2],tar[3],src[0],src[1],src[2],src[3]]
-                    tar = random.choice(nodes)
-                edgesAdded.append([src[0],src[1],src[2],src[3],tar[0],tar[1],tar[2],tar[3]])
-                edgesAdded.remove(ed)
-                f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (src[0],src[1],src[2],src[3],tar[0],tar[1],tar[2],tar[3]))
-            else:
-                f.write('    <edge source="(%d, %d, %d, %d)" target="(%d, %d, %d, %d)" />\n' % (src[0],src[1],src[2],src[3],tar[0],tar[1],tar[2],tar[3]))
-
-        f.write('  </graph>\n')
-        f.write('</graphml>')
-
-def generate_5D_P_RP(filename,N):
-    Nm1=N-1
-    with bz2.open(filename, 'wt') as f:
-        f.write("<?xml version='1.0' encoding='utf-8'?>\n")
-        f.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">\n')
-        f.write('  <graph edgedefault="undirected">\n')
-
-        nodes=[]
-        edges=[]
-
-        for i in range(0,N):
-            for j in range(0,N):
-                for k in range(0,N):
-                    for m in range(0,N):
-                        for z in range(0,N):
-                            nodes.append([i,j,k,m,z])
-                            f.write('    <node id="(%d, %d, %d, %d, %d)" />\n' % (i,j,k,m,z))
-
-        for i in range(0,N):
-            for j in range(0,N):
-                for k in range(0,N):
-                    for m in range(0,N):
-                        for z in range(0,N):
-                            if i==Nm1 and j==Nm1 and k==Nm1 and m==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,0])
-                                edges.append([i,j,k,m,z,i,j,k,0,z])
-                                edges.append([i,j,k,m,z,i,j,0,m,z])
-                                edges.append([i,j,k,m,z,i,0,k,m,z])
-                                edges.append([i,j,k,m,z,0,j,k,m,z])
-                            elif i==Nm1 and j==Nm1 and k==Nm1 and m==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k,0,z])
-                                edges.append([i,j,k,m,z,i,j,0,m,z])
-                                edges.append([i,j,k,m,z,i,0,k,m,z])
-                                edges.append([i,j,k,m,z,0,j,k,m,z])
-                            elif i==Nm1 and j==Nm1 and k==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,0])
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j,0,m,z])
-                                edges.append([i,j,k,m,z,i,0,k,m,z])
-                                edges.append([i,j,k,m,z,0,j,k,m,z])
-                            elif i==Nm1 and j==Nm1 and m==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,0])
-                                edges.append([i,j,k,m,z,i,j,k,0,z])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i,0,k,m,z])
-                                edges.append([i,j,k,m,z,0,j,k,m,z])
-                            elif i==Nm1 and k==Nm1 and m==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,0])
-                                edges.append([i,j,k,m,z,i,j,k,0,z])
-                                edges.append([i,j,k,m,z,i,j,0,m,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                                edges.append([i,j,k,m,z,0,j,k,m,z])
-                            elif j==Nm1 and k==Nm1 and m==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,0])
-                                edges.append([i,j,k,m,z,i,j,k,0,z])
-                                edges.append([i,j,k,m,z,i,j,0,m,z])
-                                edges.append([i,j,k,m,z,i,0,k,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif i==Nm1 and j==Nm1 and k==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j,0,m,z])
-                                edges.append([i,j,k,m,z,i,0,k,m,z])
-                                edges.append([i,j,k,m,z,0,j,k,m,z])
-                            elif i==Nm1 and j==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,0])
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i,0,k,m,z])
-                                edges.append([i,j,k,m,z,0,j,k,m,z])
-                            elif i==Nm1 and j==Nm1 and m==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k,0,z])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i,0,k,m,z])
-                                edges.append([i,j,k,m,z,0,j,k,m,z])
-                            elif i==Nm1 and k==Nm1 and m==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k,0,z])
-                                edges.append([i,j,k,m,z,i,j,0,m,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                                edges.append([i,j,k,m,z,0,j,k,m,z])
-                            elif i==Nm1 and k==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,0])
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j,0,m,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                                edges.append([i,j,k,m,z,0,j,k,m,z])
-                            elif i==Nm1 and m==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,0])
-                                edges.append([i,j,k,m,z,i,j,k,0,z])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                                edges.append([i,j,k,m,z,0,j,k,m,z])
-                            elif k==Nm1 and m==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,0])
-                                edges.append([i,j,k,m,z,i,j,k,0,z])
-                                edges.append([i,j,k,m,z,i,j,0,m,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif j==Nm1 and m==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,0])
-                                edges.append([i,j,k,m,z,i,j,k,0,z])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i,0,k,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif j==Nm1 and k==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,0])
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j,0,m,z])
-                                edges.append([i,j,k,m,z,i,0,k,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif j==Nm1 and k==Nm1 and m==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k,0,z])
-                                edges.append([i,j,k,m,z,i,j,0,m,z])
-                                edges.append([i,j,k,m,z,i,0,k,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif i==Nm1 and j==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i,0,k,m,z])
-                                edges.append([i,j,k,m,z,0,j,k,m,z])
-                            elif i==Nm1 and k==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j,0,m,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                                edges.append([i,j,k,m,z,0,j,k,m,z])
-                            elif i==Nm1 and m==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k,0,z])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                                edges.append([i,j,k,m,z,0,j,k,m,z])
-                            elif i==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,0])
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                                edges.append([i,j,k,m,z,0,j,k,m,z])
-                            elif j==Nm1 and k==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j,0,m,z])
-                                edges.append([i,j,k,m,z,i,0,k,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif j==Nm1 and m==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k,0,z])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i,0,k,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif j==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,0])
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i,0,k,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif k==Nm1 and m==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k,0,z])
-                                edges.append([i,j,k,m,z,i,j,0,m,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif k==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,0])
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j,0,m,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif m==Nm1 and z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,0])
-                                edges.append([i,j,k,m,z,i,j,k,0,z])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif i==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                                edges.append([i,j,k,m,z,0,j,k,m,z])
-                            elif j==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i,0,k,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif k==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j,0,m,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif m==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k,0,z])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            elif z==Nm1:
-                                edges.append([i,j,k,m,z,i,j,k,m,0])
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-                            else:
-                                edges.append([i,j,k,m,z,i,j,k,m,z+1])
-                                edges.append([i,j,k,m,z,i,j,k,m+1,z])
-                                edges.append([i,j,k,m,z,i,j,k+1,m,z])
-                                edges.append([i,j,k,m,z,i,j+1,k,m,z])
-                                edges.append([i,j,k,m,z,i+1,j,k,m,z])
-
-        cpy_edges = edges[:]
-        edgesAdded = copy.deepcopy(edges)
-        for ed in cpy_edges:
-            src=ed[0:5]
-            tar=ed[5:10]
-            if random.random() < pR:
-                tar = random.choice(nodes)
-                o1=[src[0],src[1],src[2],src[3],src[4],tar[0],tar[1],tar[2],tar[3],tar[4]]
-                o2=[tar[0],tar[1],tar[2],tar[3],tar[4],src[0],src[1],src[2],src[3],src[4]]
-                while tar == src or o1 in edgesAdded or o2 in edgesAdded:
-                    o1=[src[0],src[1],src[2],src[3],src[4],tar[0],tar[1],tar[2],tar[3],tar[4]]
-                    o2=[tar[0],tar[1],tar[2],tar[3],tar[4],src[0],src[1],src[2],src[3],src[4]]
-                    tar = random.choice(nodes)
-                edgesAdded.append([src[0],src[1],src[2],src[3],src[4],tar[0],tar[1],tar[2],tar[3],tar[4]])
-                edgesAdded.remove(ed)
-                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (src[0],src[1],src[2],src[3],src[4],tar[0],tar[1],tar[2],tar[3],tar[4]))
-            else:
-                f.write('    <edge source="(%d, %d, %d, %d, %d)" target="(%d, %d, %d, %d, %d)" />\n' % (src[0],src[1],src[2],src[3],src[4],tar[0],tar[1],tar[2],tar[3],tar[4]))
-
-        f.write('  </graph>\n')
-        f.write('</graphml>')
-
+            key=min(s,t)*num_nodes+max(s,t)
+            attempt=0
+            while t == s or (lat and key not in removed) or key in added:
+                attempt+=1
+                t=int(integers(seed,STREAM_TARGET,slot[e],num_nodes,attempt))
+                key=min(s,t)*num_nodes+max(s,t)
+                lat=bool(lattice_adjacent(s,t,N,d,periodic))
+            o=int(tar[e])
+            removed.add(min(s,o)*num_nodes+max(s,o))
+            added.add(key)
+            delta[o]=delta.get(o,0)-1
+            delta[t]=delta.get(t,0)+1
+            tar[e]=t
+        yield src,tar
+
+
+### ~~~~~~ Rewiring is resolved in this process, the workers only format and compress the chunks
+def generate_RP(filename,N,d,periodic,pR,fmt,meta,seed,jobs=1,style=('coord','none')):
+    write_lattice(filename,N,d,rewired_edge_chunks(N,d,periodic,pR,seed),fmt,meta,jobs,style=style)
 
 if __name__ == '__main__':
     main()
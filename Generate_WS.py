@@ -1,17 +1,19 @@
 #!/usr/bin/env python3
-import networkx as nx
-import bz2
+import numpy as np
 import argparse
+from Network_IO import OUTPUT_EXT, CHUNK_EDGES, write_network
+from Ensemble import add_ensemble_args, run_ensemble
+from Counter_RNG import STREAM_REWIRE, STREAM_TARGET, uniform, integers
 
 # Generate a Watts–Strogatz network 
 #
 # Authors:
 #           Miko Stulajter
 #
-# Version 1.0.0
+# Version 1.2.0
 #
 
-def argParsing():
+def argParsing(argv=None):
     parser = argparse.ArgumentParser(description='Generate a Watts–Strogatz network.')
     
     parser.add_argument('-N',
@@ -33,30 +35,90 @@ def argParsing():
     required=True)
 
     parser.add_argument('-ofile',
-    help="Output file name with no extension as it will be saved as a '.graphml.bz2' file.",
+    help="Output file name with no extension as it will be saved as a '.graphml.bz2' or '.netbin' file.",
     dest='ofile',
     type=str,
     required=False)
 
-    return parser.parse_args()
+    parser.add_argument('-format',
+    help="Output format either 'graphml' or 'binary' (Default is graphml).",
+    dest='format',
+    choices=['graphml', 'binary'],
+    default='graphml',
+    required=False)
+
+    add_ensemble_args(parser)
+
+    return parser.parse_args(argv)
 
 
 def main():
     ### ~~~~~~ Argument parsing
     args = argParsing()
 
-    ### ~~~~~~ Generate network
-    G = nx.watts_strogatz_graph(args.N,args.k,args.pR)
-
-    ### ~~~~~~ Output network
+    ### ~~~~~~ Generate all replicas
     if (args.ofile):
-        filename=args.ofile+'.graphml.bz2'
+        base=args.ofile
     else:
-        filename="WS_N-"+str(args.N)+"_k-"+str(args.k)+"_pR-"+str(args.pR)+'.graphml.bz2'
+        base="WS_N-"+str(args.N)+"_k-"+str(args.k)+"_pR-"+str(args.pR)
+    run_ensemble(generate, args, base, OUTPUT_EXT[args.format])
+
+
+def generate(args, filename, seed):
+    ### ~~~~~~ Generate and output network
+    if args.k > args.N:
+        raise ValueError("k must be less than or equal to N.")
+    meta={'model': 'WS', 'N': args.N, 'k': args.k, 'pR': args.pR, 'seed': seed}
+    edge_chunks=ws_edge_chunks(args.N,args.k,args.pR,seed)
+    write_network(filename, args.format, args.N, edge_chunks, meta)
+
+
+### ~~~~~~ Whether the pairs (a, b) are edges of the ring lattice with k//2 neighbors on each side
+def ring_adjacent(a,b,N,half):
+    c=np.abs(a-b)%N
+    c=np.minimum(c,N-c)
+    return (c >= 1) & (c <= half)
 
-    with bz2.open(filename, 'wb') as f:
-        nx.write_graphml(G, f)
 
+### ~~~~~~ Ring lattice edges (u, u+j) for j = 1..k//2, rewired as in networkx's watts_strogatz_graph:
+### ~~~~~~ in the same order each edge is rewired with probability pR to (u, w), w uniform over the nodes
+### ~~~~~~ that are not u and not connected to u, unless u is connected to every node. An edge exists
+### ~~~~~~ if it is a ring edge that has not been rewired away or if it was added by rewiring.
+### ~~~~~~ Draws for edge (u, u+j) are keyed by its slot (j-1)*N + u and the attempt number.
+def ws_edge_chunks(N,k,pR,seed):
+    if k == N:
+        yield np.triu_indices(N,1)
+        return
+    half=k//2
+    removed=set()
+    added=set()
+    delta={}
+    for j in range(1,half+1):
+        for start in range(0,N,CHUNK_EDGES):
+            src=np.arange(start,min(start+CHUNK_EDGES,N),dtype=np.int64)
+            tar=(src+j)%N
+            slot=(j-1)*N+src
+            rewire=np.flatnonzero(uniform(seed,STREAM_REWIRE,slot) < pR)
+            cand=integers(seed,STREAM_TARGET,slot[rewire],N)
+            adjacent=ring_adjacent(src[rewire],cand,N,half)
+            for e,w,ring in zip(rewire.tolist(),cand.tolist(),adjacent.tolist()):
+                u=int(src[e])
+                if 2*half+delta.get(u,0) >= N-1:
+                    continue
+                key=min(u,w)*N+max(u,w)
+                attempt=0
+                while w == u or (ring and key not in removed) or key in added:
+                    attempt+=1
+                    w=int(integers(seed,STREAM_TARGET,slot[e],N,attempt))
+                    key=min(u,w)*N+max(u,w)
+                    ring=bool(ring_adjacent(u,w,N,half))
+                v=int(tar[e])
+                removed.add(min(u,v)*N+max(u,v))
+                added.add(key)
+                delta[v]=delta.get(v,0)-1
+                delta[w]=delta.get(w,0)+1
+                tar[e]=w
+            yield src,tar
 
 if __name__ == '__main__':
     main()
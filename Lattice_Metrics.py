@@ -0,0 +1,80 @@
+import numpy as np
+
+# Closed forms of the analysis metrics of unrewired lattices
+#
+# Authors:
+#           Miko Stulajter
+#
+# Version 1.0.0
+#
+# The metrics follow the definitions used by Analysis.py, the average path length is the mean
+# distance over all ordered node pairs including a node with itself and the square clustering
+# coefficient is the one of networkx and networkit.
+#
+
+### ~~~~~~ Smallest side lengths the closed forms hold for, shorter periodic sides create
+### ~~~~~~ multi-edges or extra squares through the wrap around
+MIN_SIDE = {True: 5, False: 2}
+
+
+### ~~~~~~ Whether the closed forms hold for an L^d lattice
+def has_closed_form(L, d, periodic):
+    return d >= 1 and L >= MIN_SIDE[periodic]
+
+
+### ~~~~~~ Metrics of an unrewired L^d lattice, periodic or not
+def lattice_metrics(L, d, periodic):
+    if not has_closed_form(L, d, periodic):
+        raise ValueError("No closed form for a %s lattice with L = %d and d = %d." % ('periodic' if periodic else 'non-periodic', L, d))
+    num_nodes = L**d
+    if periodic:
+        num_edges = d*L**d
+        diameter = d*(L//2)
+        ave_path_len = d*(L*L//4)/L
+    else:
+        num_edges = d*L**(d-1)*(L-1)
+        diameter = d*(L-1)
+        ave_path_len = d*(L*L-1)/(3*L)
+    return {'num_nodes': num_nodes,
+            'num_edges': num_edges,
+            'density': 2*num_edges/(num_nodes*(num_nodes-1)),
+            'ave_degree': 2*num_edges/num_nodes,
+            'square_clustering': square_clustering(L, d, periodic),
+            'diameter': diameter,
+            'ave_path_len': ave_path_len}
+
+
+### ~~~~~~ Per coordinate classes (n, m, count): n neighbors along the coordinate, whose own numbers
+### ~~~~~~ of neighbors along it sum to m, for count positions
+def coordinate_classes(L, periodic):
+    if periodic:
+        return [(2, 4, L)]
+    n = (np.arange(L) > 0).astype(int) + (np.arange(L) < L-1)
+    m = np.concatenate(([0], n[:-1])) + np.concatenate((n[1:], [0]))
+    classes, counts = np.unique(np.stack((n, m), axis=1), axis=0, return_counts=True)
+    return [(int(c[0]), int(c[1]), int(k)) for c, k in zip(classes, counts)]
+
+
+### ~~~~~~ Mean square clustering coefficient. For a node with K neighbors, Q the sum of the squared
+### ~~~~~~ numbers of neighbors along every coordinate and M the sum of the m of its coordinates,
+### ~~~~~~ neighbor pairs along different coordinates close one square each, so
+### ~~~~~~   squares = (K^2 - Q)/2, sum of neighbor degrees = K^2 - Q + M
+### ~~~~~~   C4 = squares / ((K - 1) * sum of neighbor degrees - K(K - 1) - squares)
+### ~~~~~~ Nodes are counted by (K, Q, M) one coordinate at a time.
+def square_clustering(L, d, periodic):
+    classes = coordinate_classes(L, periodic)
+    states = {(0, 0, 0): 1}
+    for axis in range(d):
+        nxt = {}
+        for (K, Q, M), count in states.items():
+            for n, m, k in classes:
+                key = (K+n, Q+n*n, M+m)
+                nxt[key] = nxt.get(key, 0) + count*k
+        states = nxt
+    total = 0.0
+    for (K, Q, M), count in states.items():
+        squares = (K*K-Q)/2
+        potential = (K-1)*(K*K-Q+M) - K*(K-1) - squares
+        if potential > 0:
+            total += count*squares/potential
+    return total/L**d
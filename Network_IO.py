@@ -0,0 +1,375 @@
+import numpy as np
+import bz2
+import json
+import re
+import struct
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from xml.etree import ElementTree
+from Ensemble import map_blocks
+
+# Network input/output helpers shared by the generation and analysis scripts
+#
+# Authors:
+#           Miko Stulajter
+#
+# Version 1.3.4
+#
+
+GRAPHML_OPEN = ("<?xml version='1.0' encoding='utf-8'?>\n"
+    '<graphml xmlns="http://graphml.graphdrawing.org/xmlns" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">\n').encode()
+GRAPHML_GRAPH = b'  <graph edgedefault="undirected">\n'
+GRAPHML_HEADER = GRAPHML_OPEN + GRAPHML_GRAPH
+GRAPHML_FOOTER = b'  </graph>\n</graphml>'
+
+### ~~~~~~ Binary edge list format: magic, header length, JSON metadata, then (source, target) pairs
+BINARY_MAGIC = b'RNETBIN1'
+
+### ~~~~~~ File extensions of the output formats
+OUTPUT_EXT = {'graphml': '.graphml.bz2', 'binary': '.netbin'}
+
+### ~~~~~~ Number of nodes and edges formatted per block handed to the compressor
+CHUNK_NODES = 1 << 15
+CHUNK_EDGES = 1 << 17
+
+
+### ~~~~~~ Decimal digits of non-negative integers as a left aligned, zero padded uint8 matrix
+def int_digits(values):
+    values = np.asarray(values, dtype=np.int64)
+    width = len(str(int(values.max()))) if len(values) else 1
+    num_digits = np.ones(len(values), dtype=np.int64)
+    for k in range(1, width):
+        num_digits += values >= 10**k
+    out = np.zeros((len(values), width), dtype=np.uint8)
+    for k in range(width):
+        power = np.maximum(num_digits-1-k, 0)
+        digit = (values // 10**power) % 10 + ord('0')
+        out[:, k] = np.where(k < num_digits, digit, 0)
+    return out
+
+
+### ~~~~~~ Build text lines from a list of constant byte strings and per-line uint8 matrices
+def format_lines(pieces, num_lines):
+    widths = [len(p) if isinstance(p, bytes) else p.shape[1] for p in pieces]
+    out = np.zeros((num_lines, sum(widths)), dtype=np.uint8)
+    col = 0
+    for p, w in zip(pieces, widths):
+        if isinstance(p, bytes):
+            out[:, col:col+w] = np.frombuffer(p, dtype=np.uint8)
+        else:
+            out[:, col:col+w] = p
+        col += w
+    # Padding bytes are zero and never occur in GraphML text
+    flat = out.ravel()
+    return flat[flat != 0].tobytes()
+
+
+### ~~~~~~ Format node lines from node label pieces and optional (key id, value pieces) data
+def format_nodes(labels, num_nodes, data=()):
+    if not data:
+        return format_lines([b'    <node id="'] + labels + [b'" />\n'], num_nodes)
+    pieces = [b'    <node id="'] + labels + [b'">\n']
+    for key, values in data:
+        pieces += [b'      <data key="' + key + b'">'] + values + [b'</data>\n']
+    return format_lines(pieces + [b'    </node>\n'], num_nodes)
+
+
+### ~~~~~~ GraphML key declaration of a node attribute
+def graphml_key(key, name, attr_type):
+    return b'  <key id="' + key + b'" for="node" attr.name="' + name.encode() + b'" attr.type="' + attr_type.encode() + b'" />\n'
+
+
+### ~~~~~~ Format edge lines from source and target label pieces
+def format_edges(src_labels, tar_labels, num_edges):
+    return format_lines([b'    <edge source="'] + src_labels + [b'" target="'] + tar_labels + [b'" />\n'], num_edges)
+
+
+### ~~~~~~ Write a GraphML file from iterables of pre-formatted node and edge blocks
+def write_graphml_blocks(filename, node_blocks, edge_blocks, keys=b''):
+    with bz2.open(filename, 'wb') as f:
+        f.write(GRAPHML_OPEN + keys + GRAPHML_GRAPH)
+        for block in node_blocks:
+            f.write(block)
+        for block in edge_blocks:
+            f.write(block)
+        f.write(GRAPHML_FOOTER)
+
+
+### ~~~~~~ Build a block with func(*args) and compress it as a bz2 stream of its own
+def compressed_block(func, *args):
+    return bz2.compress(func(*args))
+
+
+### ~~~~~~ Write a GraphML file as concatenated bz2 streams, which bz2 readers decompress as one file.
+### ~~~~~~ Every task (func, *args) builds one block of node or edge lines, the blocks are built and
+### ~~~~~~ compressed in up to jobs processes and written in task order between a header and footer.
+def write_graphml_parallel(filename, tasks, jobs, keys=b''):
+    with open(filename, 'wb') as f:
+        f.write(bz2.compress(GRAPHML_OPEN + keys + GRAPHML_GRAPH))
+        for stream in map_blocks(compressed_block, tasks, jobs):
+            f.write(stream)
+        f.write(bz2.compress(GRAPHML_FOOTER))
+
+
+### ~~~~~~ Write a network with integer node ids 0..num_nodes-1 from an iterable of (source, target) id arrays.
+### ~~~~~~ node_data is a list of (name, type, function of node ids returning integer values) written
+### ~~~~~~ as GraphML node attributes, the binary format keeps what is needed to recover them in meta.
+def write_network(filename, fmt, num_nodes, edge_chunks, meta, node_data=()):
+    if fmt == 'binary':
+        write_binary(filename, dict(meta, num_nodes=num_nodes), edge_chunks)
+        return
+    keys = [b'd%d' % i for i in range(len(node_data))]
+
+    def node_blocks():
+        for start in range(0, num_nodes, CHUNK_NODES):
+            ids = np.arange(start, min(start+CHUNK_NODES, num_nodes))
+            data = [(key, [int_digits(values(ids))]) for key, (name, attr_type, values) in zip(keys, node_data)]
+            yield format_nodes([int_digits(ids)], len(ids), data)
+
+    def edge_blocks():
+        for src, tar in edge_chunks:
+            for start in range(0, len(src), CHUNK_EDGES):
+                s, t = src[start:start+CHUNK_EDGES], tar[start:start+CHUNK_EDGES]
+                yield format_edges([int_digits(s)], [int_digits(t)], len(s))
+
+    header = b''.join(graphml_key(key, name, attr_type) for key, (name, attr_type, values) in zip(keys, node_data))
+    write_graphml_blocks(filename, node_blocks(), edge_blocks(), header)
+
+
+### ~~~~~~ Write a binary edge list from an iterable of (source, target) id arrays
+def write_binary(filename, meta, edge_chunks):
+    dtype = np.dtype('<i4') if meta['num_nodes'] < 2**31 else np.dtype('<i8')
+    header = json.dumps(dict(meta, dtype=dtype.str)).encode()
+    # Pad the header so the edge array starts on an 8 byte boundary
+    header += b' ' * (-(len(BINARY_MAGIC)+8+len(header)) % 8)
+    with open(filename, 'wb') as f:
+        f.write(BINARY_MAGIC)
+        f.write(struct.pack('<Q', len(header)))
+        f.write(header)
+        for src, tar in edge_chunks:
+            pairs = np.empty((len(src), 2), dtype=dtype)
+            pairs[:, 0] = src
+            pairs[:, 1] = tar
+            f.write(pairs.tobytes())
+
+
+### ~~~~~~ Check whether a file is a binary edge list
+def is_binary(filename):
+    with open(filename, 'rb') as f:
+        return f.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+
+
+### ~~~~~~ Read a binary edge list as (metadata, memory mapped E x 2 edge array)
+def read_binary(filename):
+    with open(filename, 'rb') as f:
+        if f.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+            raise ValueError(filename + ' is not a binary edge list.')
+        length = struct.unpack('<Q', f.read(8))[0]
+        meta = json.loads(f.read(length))
+        offset = f.tell()
+        f.seek(0, 2)
+        size = f.tell()
+    if size == offset:
+        return meta, np.empty((0, 2), dtype=meta['dtype'])
+    edges = np.memmap(filename, dtype=meta['dtype'], mode='r', offset=offset).reshape(-1, 2)
+    return meta, edges
+
+
+### ~~~~~~ Lattice coordinates of integer node ids from the stored lattice shape
+def node_coordinates(meta, ids):
+    return np.unravel_index(ids, meta['shape'])
+
+
+### ~~~~~~ Name of the node coordinate array written next to a network file
+def coordinates_name(filename):
+    for ext in OUTPUT_EXT.values():
+        if filename.endswith(ext):
+            filename = filename[:-len(ext)]
+    return filename + '_coords.npy'
+
+
+### ~~~~~~ Decompressed bytes of GraphML parsed at a time by the regular expressions
+GRAPHML_PARSE_BYTES = 1 << 22
+
+
+### ~~~~~~ Read a '.graphml.bz2' network as (number of nodes, source ids, target ids). Nodes are
+### ~~~~~~ numbered in the order they appear in the file, whatever the style of their GraphML ids,
+### ~~~~~~ and integer ids 0..n-1 written in order map to themselves. jobs processes decompress it.
+### ~~~~~~ Files in the exact layout the generators write are matched with regular expressions a
+### ~~~~~~ chunk of lines at a time, any other GraphML is parsed as XML.
+def read_graphml(filename, jobs=1):
+    try:
+        parsed = graphml_arrays(graphml_chunks(read_bz2(filename, jobs)))
+    except (OSError, ValueError, EOFError):
+        if jobs <= 1:
+            raise
+        parsed = graphml_arrays(graphml_chunks(read_bz2(filename)))
+    if parsed is not None:
+        return graphml_ids(*parsed)
+    labels = []
+    edges = []
+    with bz2.open(filename) as f:
+        for event, elem in ElementTree.iterparse(f):
+            tag = elem.tag.rsplit('}', 1)[-1]
+            if tag == 'node':
+                labels.append(elem.get('id'))
+            elif tag == 'edge':
+                edges.append((elem.get('source'), elem.get('target')))
+            if tag in ('node', 'edge'):
+                elem.clear()
+    return graphml_ids(labels, edges)
+
+
+### ~~~~~~ Decompressed pieces regrouped into chunks of whole lines of at least GRAPHML_PARSE_BYTES
+def graphml_chunks(pieces):
+    chunk = b''
+    for piece in pieces:
+        chunk += piece
+        cut = chunk.rfind(b'\n') + 1
+        if cut >= GRAPHML_PARSE_BYTES:
+            yield chunk[:cut]
+            chunk = chunk[cut:]
+    yield chunk
+
+
+### ~~~~~~ (node labels, edge label pairs) as byte string arrays of GraphML in the layout the
+### ~~~~~~ generators write, each chunk matched and converted to arrays before the next one is read.
+### ~~~~~~ None when a chunk has a node or edge element the regular expressions do not match.
+def graphml_arrays(chunks):
+    labels = []
+    edges = []
+    for chunk in chunks:
+        if not labels and not chunk.startswith(GRAPHML_OPEN):
+            return None
+        node_ids = re.findall(rb'<node id="([^"]*)"', chunk)
+        edge_ids = re.findall(rb'<edge source="([^"]*)" target="([^"]*)"', chunk)
+        if len(node_ids) != len(re.findall(rb'<node[\s/>]', chunk)) or len(edge_ids) != len(re.findall(rb'<edge[\s/>]', chunk)):
+            return None
+        labels.append(np.array(node_ids, dtype=bytes))
+        edges.append(np.array(edge_ids, dtype=bytes).reshape(-1, 2))
+        del node_ids, edge_ids
+    return np.concatenate(labels), np.concatenate(edges)
+
+
+### ~~~~~~ (number of nodes, source ids, target ids) of node labels in file order and edges given as
+### ~~~~~~ label pairs, raises for an edge endpoint that is not a declared node
+def graphml_ids(labels, edges):
+    labels = np.asarray(labels)
+    edges = np.asarray(edges, dtype=labels.dtype if len(edges) == 0 else None).reshape(-1, 2)
+    order = np.argsort(labels, kind='stable')
+    pos = np.minimum(np.searchsorted(labels[order], edges), max(len(labels)-1, 0))
+    missing = labels[order][pos] != edges if len(labels) else np.ones(edges.shape, dtype=bool)
+    if missing.any():
+        label = edges[missing][0]
+        raise ValueError('GraphML edge endpoint "%s" is not a declared node.' % (label.decode() if isinstance(label, bytes) else label))
+    ids = order[pos] if len(labels) else pos
+    return len(labels), ids[:, 0], ids[:, 1]
+
+
+### ~~~~~~ bz2 block and end of stream magic numbers, and the stream header blocks are rewrapped in
+BZ2_BLOCK_MAGIC = bytes.fromhex('314159265359')
+BZ2_END_MAGIC = bytes.fromhex('177245385090')
+BZ2_HEADER = b'BZh9'
+
+### ~~~~~~ Bytes of compressed data scanned for magic numbers at a time
+BZ2_SCAN_BYTES = 1 << 26
+
+### ~~~~~~ Bytes of decompressed data read at a time when decompressing serially
+BZ2_READ_BYTES = 1 << 22
+
+
+### ~~~~~~ Decompressed contents of a bz2 file, yielded in pieces of at most BZ2_READ_BYTES or of
+### ~~~~~~ one block. With jobs > 1 the blocks are found by their magic numbers, rewrapped as single
+### ~~~~~~ block streams and decompressed in jobs processes, in order, as pbzip2 does. Files that
+### ~~~~~~ cannot be split are decompressed serially, a split that fails the block CRCs because
+### ~~~~~~ compressed data happened to contain a magic number raises and is read again with jobs=1.
+def read_bz2(filename, jobs=1):
+    if jobs > 1:
+        with open(filename, 'rb') as f:
+            data = f.read()
+        tasks = bz2_block_tasks(data) if data[:3] == b'BZh' else []
+        del data
+        if len(tasks) > 1:
+            yield from map_blocks(bz2_block, tasks, jobs)
+            return
+    with bz2.open(filename) as f:
+        while True:
+            piece = f.read(BZ2_READ_BYTES)
+            if not piece:
+                return
+            yield piece
+
+
+### ~~~~~~ Bit offsets of every bz2 block and end of stream magic number, matched at each of the 8 bit
+### ~~~~~~ alignments of the data
+def bz2_markers(data):
+    a = np.frombuffer(data, dtype=np.uint8)
+    blocks = []
+    ends = []
+    for start in range(0, len(a), BZ2_SCAN_BYTES):
+        seg = a[start:start+BZ2_SCAN_BYTES+len(BZ2_BLOCK_MAGIC)]
+        pairs = (seg[:-1].astype(np.uint16) << 8) | seg[1:]
+        for shift in range(8):
+            aligned = ((pairs >> (8-shift)) & 0xff).astype(np.uint8).tobytes()
+            for magic, found in ((BZ2_BLOCK_MAGIC, blocks), (BZ2_END_MAGIC, ends)):
+                pos = aligned.find(magic)
+                while 0 <= pos < BZ2_SCAN_BYTES:
+                    found.append(8*(start+pos)+shift)
+                    pos = aligned.find(magic, pos+1)
+    return sorted(blocks), sorted(ends)
+
+
+### ~~~~~~ (bytes, first bit, last bit) of every block, which runs from its magic number to the next
+### ~~~~~~ block or end of stream magic number, none if the data does not look like bz2 streams
+def bz2_block_tasks(data):
+    blocks, ends = bz2_markers(data)
+    if not blocks or not ends or blocks[0] != 8*len(BZ2_HEADER) or ends[-1] < blocks[-1]:
+        return []
+    bounds = np.array(sorted(blocks + ends))
+    stops = bounds[np.searchsorted(bounds, blocks, side='right')]
+    tasks = []
+    for first, last in zip(blocks, stops):
+        lo = first // 8
+        tasks.append((data[lo:-(-int(last) // 8)], first-8*lo, int(last)-8*lo))
+    return tasks
+
+
+### ~~~~~~ Decompress one block as a stream of its own, whose combined CRC is the block CRC that
+### ~~~~~~ follows the block magic number
+def bz2_block(chunk, first, last):
+    bits = np.unpackbits(np.frombuffer(chunk, dtype=np.uint8))[first:last]
+    crc = bits[48:80]
+    stream = np.concatenate((np.unpackbits(np.frombuffer(BZ2_HEADER, dtype=np.uint8)), bits,
+                             np.unpackbits(np.frombuffer(BZ2_END_MAGIC, dtype=np.uint8)), crc))
+    decompressor = bz2.BZ2Decompressor()
+    text = decompressor.decompress(np.packbits(stream).tobytes())
+    if not decompressor.eof:
+        raise EOFError('Incomplete bz2 block')
+    return text
+
+
+### ~~~~~~ Lazily map read over files in order as (filename, read(filename)), reading up to depth
+### ~~~~~~ files ahead on threads so decompression and parsing overlap with the work done on the
+### ~~~~~~ files already read. depth 0 reads each file when it is needed. Nothing here keeps a
+### ~~~~~~ reference to a result once it is yielded.
+def prefetch(read, files, depth):
+    if depth <= 0:
+        for filename in files:
+            yield filename, read(filename)
+        return
+    with ThreadPoolExecutor(max_workers=depth) as pool:
+        pending = deque()
+        for filename in files:
+            pending.append((filename, pool.submit(read, filename)))
+            if len(pending) > depth:
+                yield next_result(pending)
+        while pending:
+            yield next_result(pending)
+
+
+### ~~~~~~ (filename, result) of the oldest pending read, dropping its future
+def next_result(pending):
+    filename, future = pending.popleft()
+    result = future.result()
+    del future
+    return filename, result
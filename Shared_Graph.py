@@ -0,0 +1,58 @@
+import numpy as np
+from multiprocessing import shared_memory
+
+# Graph arrays in shared memory for the analysis worker processes
+#
+# Authors:
+#           Miko Stulajter
+#
+# Version 1.1.0
+#
+# The CSR adjacency and degree arrays of a graph are copied once into shared memory blocks.
+# Workers attach to the blocks by name and view them as numpy arrays, so they neither unpickle
+# nor re-read the graph and all of them share one copy of it.
+#
+
+### ~~~~~~ Copy the named arrays into shared memory, returns the blocks and the spec workers attach with
+def share_arrays(arrays):
+    blocks = []
+    spec = {}
+    for name, values in arrays.items():
+        values = np.ascontiguousarray(values)
+        block = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        np.ndarray(values.shape, dtype=values.dtype, buffer=block.buf)[...] = values
+        blocks.append(block)
+        spec[name] = (block.name, values.dtype.str, values.shape)
+    return blocks, spec
+
+
+### ~~~~~~ Attach to the blocks of a spec, returns the blocks, which must stay referenced while the
+### ~~~~~~ arrays are used, and the arrays viewing them
+def attach_arrays(spec):
+    blocks = []
+    arrays = {}
+    for name, (block_name, dtype, shape) in spec.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        blocks.append(block)
+        arrays[name] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+    return blocks, arrays
+
+
+### ~~~~~~ Close the blocks and free them if this process created them
+def release_arrays(blocks, unlink=False):
+    for block in blocks:
+        block.close()
+        if unlink:
+            block.unlink()
+
+
+### ~~~~~~ CSR adjacency (indptr, indices and unit weights) and degree arrays of a networkit graph.
+### ~~~~~~ The weights have the dtype the workers compute with, so viewing them as a sparse matrix
+### ~~~~~~ and handing it to scipy copies nothing.
+def graph_arrays(H, dtype=np.float64):
+    import networkit as nk
+    A = nk.algebraic.adjacencyMatrix(H, matrixType='sparse')
+    return {'indptr': A.indptr,
+            'indices': A.indices,
+            'data': np.ones(len(A.indices), dtype=dtype),
+            'degree': np.diff(A.indptr)}
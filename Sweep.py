@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+import argparse
+import hashlib
+import importlib
+import itertools
+import json
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from Network_IO import OUTPUT_EXT
+from Ensemble import replica_seeds
+from Analysis import analyze
+
+# Resumable parameter sweep over the generators followed by analysis
+#
+# Authors:
+#           Miko Stulajter
+#
+# Version 1.0.0
+#
+# The grid is a JSON file such as
+#   {"seeds": [0, 1, 2],
+#    "grids": [{"model": "RL", "l1": 10, "d": [2, 3], "bc": 2, "rp": [0.01, 0.1]},
+#              {"model": "ER", "N": 1000, "E": [2000, 3000]}]}
+# where every key besides "model" is a generator option without its leading dash.
+#
+
+GENERATORS = {'ER': 'Generate_ER', 'BR': 'Generate_BR', 'WS': 'Generate_WS', 'RL': 'Generate_RL'}
+
+
+def argParsing():
+    parser = argparse.ArgumentParser(description='Generate and analyze networks over a parameter grid, skipping cached cells.')
+
+    parser.add_argument('-grid',
+    help="Parameter grid as a JSON file.",
+    dest='grid',
+    type=str,
+    required=True)
+
+    parser.add_argument('-db',
+    help="SQLite file the results are stored in (Default is 'sweep.sqlite').",
+    dest='db',
+    default='sweep.sqlite',
+    type=str,
+    required=False)
+
+    parser.add_argument('-jobs',
+    help='Number of cells run at the same time (Default is 1).',
+    dest='jobs',
+    default=1,
+    type=int,
+    required=False)
+
+    parser.add_argument('-cores',
+    help='Number of cores used by each analysis (Default is 1).',
+    dest='cores',
+    default=1,
+    type=int,
+    required=False)
+
+    parser.add_argument('-workdir',
+    help="Directory generated networks are written to (Default is 'sweep_networks').",
+    dest='workdir',
+    default='sweep_networks',
+    type=str,
+    required=False)
+
+    parser.add_argument('-keep',
+    help='Keep the generated network files after analysis.',
+    dest='keep',
+    action='store_true',
+    required=False)
+
+    return parser.parse_args()
+
+
+def main():
+    ### ~~~~~~ Argument parsing
+    args = argParsing()
+
+    ### ~~~~~~ Expand the grid and skip cells already in the store
+    with open(args.grid) as f:
+        cells = expandGrid(json.load(f))
+    con = openStore(args.db)
+    done = set(row[0] for row in con.execute('SELECT key FROM sweep'))
+    todo = [cell for cell in cells if cell['key'] not in done]
+    print('Cells : %d, cached : %d, to run : %d' % (len(cells), len(cells)-len(todo), len(todo)))
+
+    ### ~~~~~~ Run the remaining cells, storing each one as soon as it finishes
+    os.makedirs(args.workdir, exist_ok=True)
+    if args.jobs > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            futures = {pool.submit(runCell, cell, args.workdir, args.cores, args.keep): cell for cell in todo}
+            for future in as_completed(futures):
+                try:
+                    results = future.result()
+                except Exception as e:
+                    reportFailure(futures[future], e)
+                    continue
+                storeCell(con, futures[future], results)
+    else:
+        for cell in todo:
+            try:
+                results = runCell(cell, args.workdir, args.cores, args.keep)
+            except Exception as e:
+                reportFailure(cell, e)
+                continue
+            storeCell(con, cell, results)
+
+    ### ~~~~~~ Print every cell of the grid
+    printCells(con, cells)
+
+
+### ~~~~~~ Every (grid point, seed) combination with its parameter-and-seed hash
+def expandGrid(grid):
+    seeds = grid.get('seeds', [0])
+    cells = []
+    for spec in grid['grids']:
+        spec = dict(spec)
+        model = spec.pop('model')
+        names = sorted(spec)
+        values = [spec[name] if isinstance(spec[name], list) else [spec[name]] for name in names]
+        for combo in itertools.product(*values):
+            for s in seeds:
+                params = dict(zip(names, combo), model=model, seed=s)
+                cells.append({'key': cellKey(params), 'params': params})
+    return cells
+
+
+def cellKey(params):
+    return hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+
+### ~~~~~~ Generate the cell's network as a binary edge list and analyze it
+def runCell(cell, workdir, cores, keep):
+    params = cell['params']
+    module = importlib.import_module(GENERATORS[params['model']])
+    argv = ['-format', 'binary']
+    for name, value in params.items():
+        if name not in ('model', 'seed'):
+            argv += ['-' + name, str(value)]
+    filename = os.path.join(workdir, cell['key'] + OUTPUT_EXT['binary'])
+
+    start = time.time()
+    module.generate(module.argParsing(argv), filename, replica_seeds(params['seed'], 1)[0])
+    results = analyze(filename, cores, params['seed'])
+    results['elapsed'] = time.time() - start
+    if not keep:
+        os.remove(filename)
+    return results
+
+
+### ~~~~~~ Results store
+def openStore(db):
+    con = sqlite3.connect(db)
+    con.execute('CREATE TABLE IF NOT EXISTS sweep (key TEXT PRIMARY KEY, model TEXT, params TEXT, seed INTEGER, results TEXT)')
+    return con
+
+
+def storeCell(con, cell, results):
+    params = cell['params']
+    with con:
+        con.execute('INSERT OR REPLACE INTO sweep VALUES (?, ?, ?, ?, ?)',
+                    (cell['key'], params['model'], json.dumps(params, sort_keys=True), params['seed'], json.dumps(results)))
+
+
+### ~~~~~~ Failed cells are not stored so they are retried on the next run
+def reportFailure(cell, e):
+    print('Cell failed : ' + json.dumps(cell['params']) + ' : ' + repr(e))
+
+
+def printCells(con, cells):
+    stored = dict(con.execute('SELECT key, results FROM sweep'))
+    for cell in cells:
+        results = json.loads(stored[cell['key']]) if cell['key'] in stored else None
+        print(json.dumps(cell['params'], sort_keys=True) + '\t' + (json.dumps(results) if results else 'missing'))
+
+
+if __name__ == '__main__':
+    main()